@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Cold-start import time benchmark.
+
+Imports main.py, cli.py and every cog in a fresh interpreter with
+`python -X importtime` and reports the cumulative import time of each, so a
+cog that pulls in a heavy dependency (or a presentation library creeping back
+into main.py's import path) shows up as a regression.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 3] [--top 5] [--budget MS] [--json]
+
+--repeat keeps the fastest of N runs per module. With --budget the script exits
+with status 1 if any module is slower than MS milliseconds or fails to import,
+so it can be used as a CI check. Run it from any directory; modules are
+imported from the repository root.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_modules():
+    modules = ["main", "cli"]
+    cogs_dir = os.path.join(ROOT, "cogs")
+    modules += [f"cogs.{name[:-3]}" for name in sorted(os.listdir(cogs_dir))
+                if name.endswith(".py") and name != "__init__.py"]
+    return modules
+
+
+def parse_importtime(stderr):
+    """Return {module: (self_us, cumulative_us)} from -X importtime output."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        timings[parts[2].strip()] = (self_us, cumulative_us)
+    return timings
+
+
+def startup_modules():
+    """Modules the interpreter imports before running any code; not attributed to the module under test."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], cwd=ROOT, capture_output=True, text=True)
+    return set(parse_importtime(result.stderr))
+
+
+def measure(module):
+    """Import `module` in a fresh interpreter; returns (cumulative_us, timings) or raises RuntimeError."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    timings = parse_importtime(result.stderr)
+    if result.returncode != 0 or module not in timings:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(errors[-1] if errors else f"exit status {result.returncode}")
+    return timings[module][1], timings
+
+
+def heaviest(timings, module, top, skip):
+    """The `top` slowest third-party/stdlib imports pulled in while importing `module`."""
+    own = (module.split(".")[0], "utils", "config", "cogs")
+    others = [(cumulative, name) for name, (_, cumulative) in timings.items()
+              if "." not in name and name not in own and name not in skip]
+    return [(name, cumulative) for cumulative, name in sorted(others, reverse=True)[:top]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", help="modules to import (default: main, cli and every cog)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=5, help="show the N heaviest top-level imports per module")
+    parser.add_argument("--budget", type=float, help="fail if any module takes longer than this many ms")
+    parser.add_argument("--json", action="store_true", help="print machine-readable results")
+    args = parser.parse_args()
+
+    skip = startup_modules()
+    results = {}
+    for module in args.modules or default_modules():
+        try:
+            runs = [measure(module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            results[module] = {"error": str(e)}
+            continue
+        cumulative, timings = min(runs, key=lambda run: run[0])
+        results[module] = {
+            "ms": round(cumulative / 1000, 1),
+            "heaviest": [{"module": name, "ms": round(us / 1000, 1)} for name, us in heaviest(timings, module, args.top, skip)],
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'module':<28} {'import ms':>10}")
+        for module, result in results.items():
+            if "error" in result:
+                print(f"{module:<28} {'FAILED':>10}  {result['error']}")
+                continue
+            print(f"{module:<28} {result['ms']:>10.1f}")
+            for dep in result["heaviest"]:
+                print(f"  {dep['module']:<26} {dep['ms']:>10.1f}")
+
+    failed = [module for module, result in results.items() if "error" in result]
+    over = [module for module, result in results.items()
+            if args.budget is not None and result.get("ms", 0) > args.budget]
+    if args.budget is not None and (failed or over):
+        print(f"\nOver budget ({args.budget:.0f} ms): {', '.join(over) or '-'}; failed: {', '.join(failed) or '-'}",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Voice playback CPU benchmark.
+
+Measures the CPU cost per concurrent voice stream of the two playback modes
+used by MusicCog (`music.playback_mode` in config.json):
+
+- pcm:  ffmpeg decodes to 48 kHz s16le PCM (FFmpegPCMAudio) and the bot encodes
+        every 20 ms frame to Opus in Python threads, as nextcord does for PCM sources.
+- opus: ffmpeg passes the Opus stream through into Ogg (FFmpegOpusAudio with
+        codec="opus") and the bot only splits it into packets.
+
+Streams are decoded as fast as possible rather than in real time, so the numbers
+are CPU time per second of audio, not wall-clock load.
+
+Usage:
+    python benchmarks/voice_cpu.py [--input FILE] [--streams 1 4 8] [--seconds 60]
+
+Without --input a synthetic Opus/WebM file is generated with ffmpeg. Linux/macOS only
+(uses the resource module to read ffmpeg's CPU time).
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+FRAME_SIZE = 960  # samples per channel in a 20 ms frame at 48 kHz
+FRAME_BYTES = FRAME_SIZE * 2 * 2  # stereo, 16-bit
+
+try:
+    from nextcord import opus
+    from nextcord.oggparse import OggStream
+except ImportError:
+    opus = None
+    OggStream = None
+
+
+def make_input(ffmpeg, seconds, directory):
+    """Generate a stereo Opus/WebM test tone similar to what YouTube serves."""
+    path = os.path.join(directory, "bench.webm")
+    subprocess.run(
+        [ffmpeg, "-nostdin", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=frequency=440:sample_rate=48000:duration={seconds}",
+         "-ac", "2", "-c:a", "libopus", "-b:a", "128k", "-y", path],
+        check=True,
+    )
+    return path
+
+
+def ffmpeg_args(ffmpeg, mode, source):
+    """The same ffmpeg invocations nextcord builds for each source type."""
+    if mode == "pcm":
+        return [ffmpeg, "-nostdin", "-i", source, "-f", "s16le", "-ar", "48000", "-ac", "2",
+                "-loglevel", "warning", "pipe:1"]
+    return [ffmpeg, "-nostdin", "-i", source, "-map_metadata", "-1", "-f", "opus", "-c:a", "copy",
+            "-ar", "48000", "-ac", "2", "-b:a", "128k", "-loglevel", "warning", "pipe:1"]
+
+
+def consume(mode, stdout, encoder_factory, counts, index):
+    """Read one stream the way the voice player would."""
+    frames = 0
+    if mode == "pcm":
+        encoder = encoder_factory() if encoder_factory else None
+        while True:
+            frame = stdout.read(FRAME_BYTES)
+            if len(frame) < FRAME_BYTES:
+                break
+            if encoder is not None:
+                encoder.encode(frame, FRAME_SIZE)
+            frames += 1
+    elif OggStream is not None:
+        for _ in OggStream(stdout).iter_packets():
+            frames += 1
+    else:
+        while stdout.read(65536):
+            frames += 1
+    counts[index] = frames
+
+
+def run(mode, streams, source, ffmpeg, encoder_factory):
+    children_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_before = time.process_time()
+    wall_before = time.perf_counter()
+
+    processes = [subprocess.Popen(ffmpeg_args(ffmpeg, mode, source), stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
+                 for _ in range(streams)]
+    counts = [0] * streams
+    threads = [threading.Thread(target=consume, args=(mode, process.stdout, encoder_factory, counts, i))
+               for i, process in enumerate(processes)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for process in processes:
+        process.wait()
+
+    wall = time.perf_counter() - wall_before
+    python_cpu = time.process_time() - cpu_before
+    children_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    ffmpeg_cpu = ((children_after.ru_utime - children_before.ru_utime)
+                  + (children_after.ru_stime - children_before.ru_stime))
+    return ffmpeg_cpu, python_cpu, wall, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CPU per concurrent voice stream, PCM vs Opus passthrough.")
+    parser.add_argument("--input", help="Audio file or URL to play (default: generated Opus/WebM tone)")
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 4, 8], help="Concurrent stream counts")
+    parser.add_argument("--seconds", type=int, default=60, help="Length of the generated input")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="ffmpeg executable")
+    args = parser.parse_args()
+
+    encoder_factory = None
+    if opus is not None:
+        try:
+            opus.Encoder()
+            encoder_factory = opus.Encoder
+        except Exception as e:
+            print(f"libopus not available ({e}); PCM mode will not include Python-side encoding.")
+    else:
+        print("nextcord not installed; PCM mode will not include Python-side encoding.")
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = args.input or make_input(args.ffmpeg, args.seconds, directory)
+
+        print(f"{'mode':<6}{'streams':>8}{'ffmpeg s':>10}{'python s':>10}{'wall s':>8}{'audio s':>9}"
+              f"{'cpu ms / audio s / stream':>28}")
+        for mode in ("pcm", "opus"):
+            for streams in args.streams:
+                ffmpeg_cpu, python_cpu, wall, counts = run(mode, streams, source, args.ffmpeg, encoder_factory)
+                if mode == "pcm":
+                    audio_seconds = sum(counts) * 0.02
+                else:
+                    # Opus packets from YouTube and libopus are 20 ms each
+                    audio_seconds = sum(counts) * 0.02 if OggStream is not None else args.seconds * streams
+                per_stream = (ffmpeg_cpu + python_cpu) * 1000 / audio_seconds if audio_seconds else 0.0
+                print(f"{mode:<6}{streams:>8}{ffmpeg_cpu:>10.2f}{python_cpu:>10.2f}{wall:>8.2f}"
+                      f"{audio_seconds / streams:>9.1f}{per_stream:>28.3f}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
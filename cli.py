@@ -0,0 +1,261 @@
+"""
+Interactive console UI for main.py.
+
+Kept out of main.py so the presentation libraries (rich, colorama) and the rich
+traceback hook are only loaded when the interactive CLI is used, not in
+headless mode.
+"""
+import os
+import sys
+import time
+import random
+from datetime import datetime
+from config import BOT_TOKENS, LOADING_BAR_DURATION, LOADING_BAR_LENGTH
+from utils.cog_loader import discover_cogs, load_cogs
+
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+from rich.table import Table
+from rich.prompt import Prompt
+from rich.traceback import install
+from colorama import init
+
+# Initialize colorama for cross-platform colors
+init(autoreset=True)
+
+# Install rich traceback handler
+install()
+
+# Create rich console
+console = Console()
+
+class HackerCLI:
+    def __init__(self):
+        self.console = console
+        self.start_time = datetime.now()
+        
+    def clear_screen(self):
+        """Clear the terminal screen"""
+        os.system('cls' if os.name == 'nt' else 'clear')
+    
+    def matrix_effect(self, text, delay=0.03):
+        """Create a matrix-style typing effect"""
+        for char in text:
+            self.console.print(char, style="bold green", end="")
+            time.sleep(delay)
+        self.console.print()
+    
+    def hacker_banner(self):
+        """Display the main hacker-style banner"""
+        self.clear_screen()
+        
+        # ASCII art banner
+        banner_text = """
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                                                                              ║
+║  ██████╗  ██████╗ ██╗  ██╗███████╗████████╗████████╗ ██████╗                 ║
+║  ██╔══██╗██╔═══██╗██║ ██╔╝██╔════╝╚══██╔══╝╚══██╔══╝██╔═══██╗                ║
+║  ██████╔╝██║   ██║█████╔╝ █████╗     ██║      ██║   ██║   ██║                ║
+║  ██╔══██╗██║   ██║██╔═██╗ ██╔══╝     ██║      ██║   ██║   ██║                ║
+║  ██████╔╝╚██████╔╝██║  ██╗███████╗   ██║      ██║   ╚██████╔╝                ║
+║  ╚═════╝  ╚═════╝ ╚═╝  ╚═╝╚══════╝   ╚═╝      ╚═╝    ╚═════╝                 ║
+║                                                                              ║
+║                    [bold red]DISCORD BOT CONTROL CENTER[/bold red]           ║
+║                                                                              ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+        """
+        
+        self.console.print(Panel(banner_text, style="bold blue"))
+        
+        # System info
+        system_info = f"""
+[bold cyan]SYSTEM STATUS:[/bold cyan] [green]ONLINE[/green]
+[bold cyan]INITIALIZATION TIME:[/bold cyan] {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
+[bold cyan]PYTHON VERSION:[/bold cyan] {sys.version.split()[0]}
+[bold cyan]PLATFORM:[/bold cyan] {sys.platform}
+        """
+        
+        self.console.print(Panel(system_info, title="[bold red]SYSTEM INFO[/bold red]", style="cyan"))
+    
+    def loading_sequence(self, message="Initializing system", duration=3):
+        """Animated loading sequence with progress bar"""
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeElapsedColumn(),
+            console=self.console
+        ) as progress:
+            task = progress.add_task(message, total=100)
+            
+            for i in range(100):
+                progress.update(task, advance=1)
+                time.sleep(duration / 100)
+    
+    def matrix_loading(self, text, duration=2):
+        """Matrix-style loading animation"""
+        chars = "01"
+        for _ in range(int(duration * 20)):
+            matrix_line = "".join(random.choice(chars) for _ in range(50))
+            self.console.print(f"[green]{matrix_line}[/green]", end="\r")
+            time.sleep(0.05)
+        self.console.print()
+        self.matrix_effect(text, delay=0.02)
+    
+    def display_bot_selection(self, bot_names):
+        """Display bot selection with enhanced styling"""
+        self.console.print("\n[bold yellow]╔══════════════════════════════════════════════════════════════════════════════╗[/bold yellow]")
+        self.console.print("[bold yellow]║[/bold yellow] [bold red]AVAILABLE BOT INSTANCES[/bold red] [bold yellow]     ║[/bold yellow]")
+        self.console.print("[bold yellow]╚══════════════════════════════════════════════════════════════════════════════╝[/bold yellow]")
+        
+        table = Table(show_header=True, header_style="bold magenta", border_style="blue")
+        table.add_column("ID", style="cyan", justify="center")
+        table.add_column("Bot Name", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Token Status", style="red")
+        
+        for index, bot_name in enumerate(bot_names, start=1):
+            token = BOT_TOKENS.get(bot_name, "")
+            status = "🟢 READY" if token else "🔴 OFFLINE"
+            token_status = "✓ VALID" if token else "✗ MISSING"
+            
+            table.add_row(
+                str(index),
+                bot_name,
+                status,
+                token_status
+            )
+        
+        self.console.print(table)
+    
+    def get_bot_selection(self, bot_names):
+        """Get user bot selection with validation"""
+        while True:
+            try:
+                selection = Prompt.ask(
+                    "\n[bold cyan]SELECT BOT INSTANCE[/bold cyan]",
+                    choices=[str(i) for i in range(1, len(bot_names) + 1)],
+                    default="1"
+                )
+                return int(selection)
+            except KeyboardInterrupt:
+                self.console.print("\n[bold red]Operation cancelled by user[/bold red]")
+                sys.exit(0)
+    
+    def display_bot_startup(self, bot_name):
+        """Display bot startup sequence"""
+        self.console.print(f"\n[bold blue]╔══════════════════════════════════════════════════════════════════════════════╗[/bold blue]")
+        self.console.print(f"[bold blue]║[/bold blue] [bold green]INITIALIZING: {bot_name.upper()}[/bold green] [bold blue]║[/bold blue]")
+        self.console.print(f"[bold blue]╚══════════════════════════════════════════════════════════════════════════════╝[/bold blue]")
+        
+        # Matrix effect for bot name
+        self.matrix_loading(f"Loading {bot_name}...", 1.5)
+        
+        # Startup sequence
+        startup_steps = [
+            "Validating bot credentials...",
+            "Establishing Discord connection...",
+            "Loading command modules...",
+            "Initializing voice systems...",
+            "Setting up event handlers...",
+            "Configuring bot presence...",
+            "Starting bot instance..."
+        ]
+        
+        for step in startup_steps:
+            self.loading_sequence(step, 0.8)
+    
+    def display_guild_info(self, guilds):
+        """Display guild information in a styled table"""
+        if not guilds:
+            self.console.print("[yellow]No guilds connected[/yellow]")
+            return
+        
+        self.console.print(f"\n[bold green]╔══════════════════════════════════════════════════════════════════════════════╗[/bold green]")
+        self.console.print("[bold green]║[/bold green] [bold white]CONNECTED GUILDS[/bold white] [bold green]║[/bold green]")
+        self.console.print("[bold green]╚══════════════════════════════════════════════════════════════════════════════╝[/bold green]")
+        
+        table = Table(show_header=True, header_style="bold magenta", border_style="green")
+        table.add_column("Guild Name", style="cyan")
+        table.add_column("Guild ID", style="yellow")
+        table.add_column("Member Count", style="green")
+        table.add_column("Bot Permissions", style="red")
+        
+        for guild in guilds:
+            permissions = []
+            if guild.me.guild_permissions.administrator:
+                permissions.append("ADMIN")
+            if guild.me.guild_permissions.manage_channels:
+                permissions.append("MANAGE_CHANNELS")
+            if guild.me.guild_permissions.manage_messages:
+                permissions.append("MANAGE_MESSAGES")
+            
+            perm_text = ", ".join(permissions) if permissions else "BASIC"
+            
+            table.add_row(
+                guild.name,
+                str(guild.id),
+                str(guild.member_count),
+                perm_text
+            )
+        
+        self.console.print(table)
+    
+    def display_cog_loading(self, bot, cogs_dir):
+        """Display cog loading with progress"""
+        if not os.path.exists(cogs_dir):
+            self.console.print(f"[red]Cogs directory {cogs_dir} not found![/red]")
+            return []
+        
+        initial_extensions = discover_cogs(cogs_dir)
+        
+        if not initial_extensions:
+            self.console.print("[yellow]No cogs found to load[/yellow]")
+            return []
+        
+        self.console.print(f"\n[bold blue]╔══════════════════════════════════════════════════════════════════════════════╗[/bold blue]")
+        self.console.print("[bold blue]║[/bold blue] [bold white]LOADING COMMAND MODULES[/bold white] [bold blue]║[/bold blue]")
+        self.console.print("[bold blue]╚══════════════════════════════════════════════════════════════════════════════╝[/bold blue]")
+        
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            console=self.console
+        ) as progress:
+            task = progress.add_task("Importing cogs...", total=len(initial_extensions))
+
+            def on_loaded(entry):
+                progress.update(task, description=f"Loaded {entry['name']}")
+                progress.advance(task)
+
+            report = load_cogs(bot, cogs_dir, on_loaded=on_loaded)
+
+        loaded_cogs = [entry for entry in report if entry["error"] is None]
+        failed_cogs = [entry for entry in report if entry["error"] is not None]
+        
+        # Display results
+        if loaded_cogs:
+            self.console.print(f"\n[green]✓ Successfully loaded {len(loaded_cogs)} cogs[/green]")
+            for entry in loaded_cogs:
+                self.console.print(f"  [green]•[/green] {entry['name']} [dim](import {entry['import_ms']} ms, body {entry['exec_ms']} ms, setup {entry['setup_ms']} ms)[/dim]")
+        
+        if failed_cogs:
+            self.console.print(f"\n[red]✗ Failed to load {len(failed_cogs)} cogs[/red]")
+            for entry in failed_cogs:
+                self.console.print(f"  [red]•[/red] {entry['name']}: {entry['error']}")
+        
+        return [entry["name"] for entry in loaded_cogs]
+
+# Utility function for loading bar (keeping for compatibility)
+def loading_bar(duration=LOADING_BAR_DURATION, bar_length=LOADING_BAR_LENGTH):
+    for i in range(bar_length + 1):
+        percent = (i / bar_length) * 100
+        bar = "#" * i + "-" * (bar_length - i)
+        sys.stdout.write(f"\r[{bar}] {percent:.1f}%")
+        sys.stdout.flush()
+        time.sleep(duration / bar_length)
+    print()
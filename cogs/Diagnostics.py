@@ -0,0 +1,47 @@
+import nextcord
+from nextcord import Interaction
+from nextcord.ext import commands
+from config import ALLOWED_USER_ID
+from utils.cog_loader import cog_ms
+
+class Diagnostics(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+
+    @nextcord.slash_command(name="diag", description="Bot diagnostics.")
+    async def diag(self, interaction: Interaction):
+        pass
+
+    @diag.subcommand(name="startup", description="Show how long startup and each cog took to load.")
+    async def diag_startup(self, interaction: Interaction):
+        if interaction.user.id != ALLOWED_USER_ID:
+            await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True)
+            return
+
+        timings = getattr(self.bot, "startup_timings", {})
+        report = getattr(self.bot, "startup_report", {})
+        cogs = report.get("cogs", [])
+
+        phases = ", ".join(f"{phase} {seconds:.2f}s" for phase, seconds in timings.items())
+        embed = nextcord.Embed(
+            title="Startup",
+            description=(f"Phases: {phases or 'not recorded'}\n"
+                         f"Cogs: {len(cogs)} in {report.get('cogs_ms', 0)} ms (imports run in parallel), "
+                         f"{report.get('shared_ms', 0)} ms of it shared dependencies"),
+            color=nextcord.Color.blue()
+        )
+
+        # Slowest first, so the cog to look at is at the top
+        lines = []
+        for entry in sorted(cogs, key=cog_ms, reverse=True):
+            if entry["error"]:
+                lines.append(f"`{entry['name']}` failed: {entry['error'][:100]}")
+            else:
+                lines.append(f"`{entry['name']}` {cog_ms(entry):.0f} ms "
+                             f"(import {entry['import_ms']:.0f}, body {entry['exec_ms']:.0f}, setup {entry['setup_ms']:.0f})")
+        embed.add_field(name="Cogs", value="\n".join(lines)[:1024] or "No cogs recorded", inline=False)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+def setup(bot):
+    bot.add_cog(Diagnostics(bot))
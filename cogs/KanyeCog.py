@@ -1,24 +1,44 @@
 import nextcord
 from nextcord.ext import commands
 import aiohttp
+import asyncio
+from utils.cache import TTLCache
+from utils.http_client import get_http_pool
+from utils.singleflight import SingleFlight
+
+# Quotes fetched within this many seconds of each other are shared
+QUOTE_CACHE_SECONDS = 5
 
 class KanyeCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.http = get_http_pool(bot)
+        self.flights = SingleFlight()
+        self.quotes = TTLCache(maxsize=1, ttl=QUOTE_CACHE_SECONDS)
+
+    async def fetch_quote(self):
+        """Fetch a quote, sharing one request between concurrent callers. Returns None on failure."""
+        quote = self.quotes.get("quote")
+        if quote is not None:
+            return quote
+
+        try:
+            status, data = await self.flights.do("quote", self.http.get_json, 'https://api.kanye.rest')
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+
+        quote = data.get("quote") if status == 200 and data else None
+        if quote:
+            self.quotes.set("quote", quote)
+        return quote
 
     @nextcord.slash_command(name="kanye", description="Get a random Kanye West quote.")
     async def kanye(self, interaction: nextcord.Interaction):
-        async with aiohttp.ClientSession() as session:
-            async with session.get('https://api.kanye.rest') as response:
-                if response.status == 200:
-                    data = await response.json()
-                    quote = data.get("quote")
-                    if quote:
-                        await interaction.response.send_message(f"Kanye says: \"{quote}\"")
-                    else:
-                        await interaction.response.send_message("Couldn't fetch a quote, please try again later.")
-                else:
-                    await interaction.response.send_message("Failed to reach the Kanye Rest API, please try again later.")
+        quote = await self.fetch_quote()
+        if quote:
+            await interaction.response.send_message(f"Kanye says: \"{quote}\"")
+        else:
+            await interaction.response.send_message("Couldn't fetch a quote, please try again later.")
 
 # Setup the cog
 def setup(bot):
@@ -1,76 +1,139 @@
 import nextcord
 from nextcord.ext import commands
 from nextcord import Interaction
-import requests
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
+from utils.http_client import get_http_pool
+from utils.cooldowns import cooldown
+from utils.match_feed import get_match_feed
 
-def get_matches():
-    api = "https://streamed.su/api/matches/football/popular"
-    response = requests.get(api)
+def build_match_embed(match):
+    embed = nextcord.Embed(
+        title=match.get("title", "No Title"),
+        description=match.get("category", "Unknown Category"),
+        color=0x1F8B4C
+    )
     
-    if response.status_code == 200:
-        matches = response.json()
-        return matches
-    elif response.status_code == 400:
-        print(response)
-        return None
+    # Check if the date exists and handle the None case
+    if match.get("date") is not None:
+        match_date = datetime.fromtimestamp(match["date"] / 1000).strftime('%Y-%m-%d %H:%M:%S')
+        embed.add_field(name="Date", value=match_date)
     else:
-        return None
+        embed.add_field(name="Date", value="Date not available")
+    
+    if match.get("teams"):
+        home_team = match["teams"]["home"]["name"] if match["teams"].get("home") else "TBD"
+        away_team = match["teams"]["away"]["name"] if match["teams"].get("away") else "TBD"
+        embed.add_field(name="Teams", value=f"{home_team} vs {away_team}")
+        
+    # Validate and add the thumbnail URL
+    if match.get("poster") and match["poster"].startswith("http"):
+        embed.set_thumbnail(url=match["poster"])
+
+    return embed
+
+class MatchPages(nextcord.ui.View):
+    """Pages through match embeds, up to 10 (Discord's per-message limit) at a time."""
+
+    def __init__(self, embeds, author_id, per_page=10, timeout=300):
+        super().__init__(timeout=timeout)
+        self.pages = [embeds[i:i + per_page] for i in range(0, len(embeds), per_page)]
+        self.page = 0
+        self.author_id = author_id
+        self.message = None
+        self.update_buttons()
+
+    @property
+    def current_embeds(self):
+        return self.pages[self.page]
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page == len(self.pages) - 1
+        self.page_counter.label = f"Page {self.page + 1}/{len(self.pages)}"
+
+    async def interaction_check(self, interaction: Interaction):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("Run /matches yourself to browse the list.", ephemeral=True)
+            return False
+        return True
+
+    async def show_page(self, interaction: Interaction, page):
+        self.page = page
+        self.update_buttons()
+        await interaction.response.edit_message(embeds=self.current_embeds, view=self)
+
+    @nextcord.ui.button(label="Previous", style=nextcord.ButtonStyle.secondary)
+    async def previous_page(self, button: nextcord.ui.Button, interaction: Interaction):
+        await self.show_page(interaction, self.page - 1)
+
+    @nextcord.ui.button(label="Page", style=nextcord.ButtonStyle.secondary, disabled=True)
+    async def page_counter(self, button: nextcord.ui.Button, interaction: Interaction):
+        pass
+
+    @nextcord.ui.button(label="Next", style=nextcord.ButtonStyle.primary)
+    async def next_page(self, button: nextcord.ui.Button, interaction: Interaction):
+        await self.show_page(interaction, self.page + 1)
+
+    async def on_timeout(self):
+        # Leave the last page visible but stop accepting clicks
+        self.previous_page.disabled = True
+        self.next_page.disabled = True
+        if self.message is not None:
+            try:
+                await self.message.edit(view=self)
+            except nextcord.HTTPException:
+                pass
 
 class MatchCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.cooldowns = {}  # Dictionary to store cooldowns for each user
+
+        # Process-wide snapshot of the feed, refreshed in the background so /matches never waits on the network
+        self.feed = get_match_feed(get_http_pool(bot))
+        self.feed.acquire()
+        self._embeds = []
+        self._embeds_version = None
+
+    def cog_unload(self):
+        self.feed.release()
+
+    @property
+    def embeds(self):
+        """Embeds for the current snapshot, rebuilt only when the feed changed."""
+        if self._embeds_version != self.feed.version:
+            embeds = []
+            for match in self.feed.matches or []:
+                try:
+                    embeds.append(build_match_embed(match))
+                except Exception as e:
+                    # Skip entries the feed sent in an unexpected shape instead of failing the whole list
+                    print(f"Skipping malformed match entry: {e}")
+            self._embeds = embeds
+            self._embeds_version = self.feed.version
+        return self._embeds
 
     @nextcord.slash_command(name="matches", description="Get a list of football matches.")
+    @cooldown(60)  # per user; expired entries are swept automatically
     async def send_matches(self, interaction: Interaction):
-        user_id = interaction.user.id
-        current_time = datetime.now()
-
-        # Check if the user is on cooldown
-        if user_id in self.cooldowns:
-            cooldown_expiry = self.cooldowns[user_id]
-            if current_time < cooldown_expiry:
-                time_remaining = (cooldown_expiry - current_time).seconds
-                await interaction.response.send_message(f"Please wait {time_remaining} seconds before using this command again.", ephemeral=True)
-                return
+        # Only the very first request after startup can have to wait for the feed
+        if not self.feed.ready.is_set():
+            try:
+                await asyncio.wait_for(self.feed.ready.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                pass
         
-        # Set the user's cooldown to 10 seconds from now
-        self.cooldowns[user_id] = current_time + timedelta(seconds=60)
-        matches = get_matches()
-        
-        if not matches:
+        embeds = self.embeds
+        if not embeds:
             await interaction.response.send_message("Could not retrieve matches.", ephemeral=True)
             return
         
-        await interaction.response.defer()  # Defers the response to give time for follow-up messages
-        
-        for match in matches:
-            embed = nextcord.Embed(
-                title=match.get("title", "No Title"),
-                description=match.get("category", "Unknown Category"),
-                color=0x1F8B4C
-            )
-            
-            # Check if the date exists and handle the None case
-            if match.get("date") is not None:
-                match_date = datetime.fromtimestamp(match["date"] / 1000).strftime('%Y-%m-%d %H:%M:%S')
-                embed.add_field(name="Date", value=match_date)
-            else:
-                embed.add_field(name="Date", value="Date not available")
-            
-            if match.get("teams"):
-                home_team = match["teams"]["home"]["name"] if match["teams"]["home"] else "TBD"
-                away_team = match["teams"]["away"]["name"] if match["teams"]["away"] else "TBD"
-                embed.add_field(name="Teams", value=f"{home_team} vs {away_team}")
-                
-            # Validate and add the thumbnail URL
-            if match.get("poster") and match["poster"].startswith("http"):
-                embed.set_thumbnail(url=match["poster"])
-
-            await interaction.followup.send(embed=embed)
-            await asyncio.sleep(2)  # Add a 2-second cooldown between embeds
+        # One message with up to 10 embeds; further pages are shown by editing it from the buttons
+        if len(embeds) <= 10:
+            await interaction.response.send_message(embeds=embeds)
+            return
+
+        view = MatchPages(embeds, interaction.user.id)
+        view.message = await interaction.response.send_message(embeds=view.current_embeds, view=view)
 def setup(bot):
     bot.add_cog(MatchCog(bot))
-
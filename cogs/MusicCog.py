@@ -1,17 +1,46 @@
 import nextcord
-from nextcord.ext import commands
+from nextcord.ext import commands, tasks
 from nextcord import Interaction, SlashOption
-from yt_dlp import YoutubeDL
 import asyncio
+import itertools
 import os
 import traceback
+from utils.ytdl import get_resolver, search_cache, is_url, Track
+from utils.autocomplete import AutocompleteScheduler
+from utils.music_queue import GuildQueue
+from utils.audio_cache import get_audio_cache
+from utils.voice_pool import VoiceSessionPool, VoicePoolFull
+from config import MUSIC_PLAYBACK_MODE, MUSIC_VOICE_REAP_INTERVAL, ALLOWED_USER_ID
 
 class Music(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.voice_clients = {}
-        self.song_queue = {}
+        self.voice_sessions = VoiceSessionPool()
+        self.song_queue = {}  # guild_id -> GuildQueue
+        self.prefetch_tasks = {}  # guild_id -> (track, task) resolving the next song's stream
         self.ffmpeg_path = self.find_ffmpeg()
+        self.resolver = get_resolver()
+        self.audio_cache = get_audio_cache()
+        self.autocomplete = AutocompleteScheduler()
+        self.reap_sessions.change_interval(seconds=MUSIC_VOICE_REAP_INTERVAL)
+        self.reap_sessions.start()
+
+    def cog_unload(self):
+        self.reap_sessions.cancel()
+
+    def export_state(self):
+        """Live playback state handed to the new instance on a hot reload (see utils.hot_reload)."""
+        return {
+            "voice_sessions": self.voice_sessions,
+            "song_queue": self.song_queue,
+            "prefetch_tasks": self.prefetch_tasks,
+        }
+
+    def import_state(self, state):
+        # The same objects are taken over, so in-flight coroutines of the old instance stay consistent
+        self.voice_sessions = state["voice_sessions"]
+        self.song_queue = state["song_queue"]
+        self.prefetch_tasks = state["prefetch_tasks"]
 
     def find_ffmpeg(self):
         """Attempt to find FFmpeg executable."""
@@ -28,71 +57,106 @@ class Music(commands.Cog):
 
     async def connect_to_voice(self, interaction: Interaction):
         """Establish connection to voice channel."""
+        async def reply(message):
+            # /play and /playlist defer before connecting, so the response may already be used
+            if interaction.response.is_done():
+                await interaction.followup.send(message, ephemeral=True)
+            else:
+                await interaction.response.send_message(message, ephemeral=True)
+
         if interaction.user.voice is None:
-            await interaction.response.send_message("You must be in a voice channel to play music.", ephemeral=True)
+            await reply("You must be in a voice channel to play music.")
             return None
 
-        voice_channel = interaction.user.voice.channel
-        guild_id = interaction.guild.id
-
         try:
-            # If already connected, move to the user's channel
-            if guild_id in self.voice_clients:
-                await self.voice_clients[guild_id].move_to(voice_channel)
-                return self.voice_clients[guild_id]
-            
-            # Connect to the voice channel
-            voice_client = await voice_channel.connect()
-            self.voice_clients[guild_id] = voice_client
-            return voice_client
+            # Moves to the user's channel if already connected, reconnects if the connection dropped
+            return await self.voice_sessions.connect(interaction.user.voice.channel)
+        except VoicePoolFull as e:
+            await reply(str(e))
+            return None
         except Exception as e:
-            await interaction.response.send_message(f"Error connecting to voice channel: {str(e)}", ephemeral=True)
+            await reply(f"Error connecting to voice channel: {str(e)}")
             return None
 
-    async def search_songs(self, query: str):
-        """Search for songs using yt-dlp."""
+    async def close_session(self, guild_id):
+        """Clear the guild's queue and leave its voice channel. Returns False if not connected."""
+        self.song_queue.pop(guild_id, None)
+        self.cancel_prefetch(guild_id)
+        return await self.voice_sessions.disconnect(guild_id)
+
+    @tasks.loop(seconds=30)
+    async def reap_sessions(self):
+        """Leave voice channels that are empty, idle for too long, or whose connection is gone."""
+        for guild_id, reason in self.voice_sessions.reap_candidates():
+            queue = self.song_queue.get(guild_id)
+            await self.close_session(guild_id)
+            print(f"Left voice in guild {guild_id}: {reason}")
+            if queue is not None and queue.channel is not None and reason != "connection lost":
+                try:
+                    await queue.channel.send(f"Left the voice channel because {reason}.")
+                except nextcord.HTTPException:
+                    pass
+
+    @reap_sessions.before_loop
+    async def before_reap_sessions(self):
+        await self.bot.wait_until_ready()
+
+    async def search_songs(self, query: str, guild_id=None, allow_prefix=False, count=True):
+        """
+        Search for songs using yt-dlp, answering from the shared search cache when possible.
+
+        Callers that already missed the cache for `query` pass count=False so the
+        miss is not counted twice.
+        """
+        cached = search_cache.get_results(query, allow_prefix=allow_prefix, count=count)
+        if cached is not None:
+            return cached
+
+        # Flat extraction only lists the results; streams are resolved when a song is played
         ydl_opts = {
-            'format': 'bestaudio/best',
             'quiet': True,
             'noplaylist': True,
+            'extract_flat': 'in_playlist',
             'default_search': 'ytsearch',
         }
         
         results = []
         try:
-            with YoutubeDL(ydl_opts) as ydl:
-                search_results = ydl.extract_info(f"ytsearch10:{query}", download=False)['entries']
-                for result in search_results:
+            info = await self.resolver.extract(f"ytsearch10:{query}", ydl_opts, guild_id=guild_id)
+            for result in info['entries']:
+                url = result.get("webpage_url") or result.get("url", "")
+                if url:
                     results.append({
                         "title": result.get("title", "Unknown Title"), 
-                        "url": result.get("webpage_url", "")
+                        "url": url
                     })
+            search_cache.set_results(query, results)
         except Exception as e:
             print(f"Error searching songs: {traceback.format_exc()}")
         
         return results
 
-    async def get_audio_source(self, url):
-        """Retrieve audio source for a given URL."""
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'noplaylist': True,
-            'quiet': True,
-        }
-        
-        try:
-            with YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                audio_url = info['url']
-                
-                return nextcord.FFmpegPCMAudio(
-                    audio_url, 
-                    executable=self.ffmpeg_path,
-                    before_options="-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
-                )
-        except Exception as e:
-            print(f"Error getting audio source: {traceback.format_exc()}")
-            return None
+    def create_audio_source(self, track, cached_path=None):
+        """Build a playable audio source from a cached Opus file or a resolved track."""
+        if cached_path:
+            # Already Opus on disk: ffmpeg only remuxes, nothing is re-encoded
+            return nextcord.FFmpegOpusAudio(cached_path, codec='opus', executable=self.ffmpeg_path)
+
+        before_options = "-reconnect 1 -reconnect_streamed 1 -reconnect_delay_max 5"
+        if MUSIC_PLAYBACK_MODE == 'opus':
+            # Opus streams are passed straight through; anything else is encoded to Opus by
+            # ffmpeg, so nextcord never has to encode PCM frames itself
+            return nextcord.FFmpegOpusAudio(
+                track.stream_url,
+                codec='opus' if track.codec == 'opus' else None,
+                executable=self.ffmpeg_path,
+                before_options=before_options
+            )
+        return nextcord.FFmpegPCMAudio(
+            track.stream_url, 
+            executable=self.ffmpeg_path,
+            before_options=before_options
+        )
 
     @nextcord.slash_command(name="play", description="Play a song in your voice channel.")
     async def play_music(
@@ -120,87 +184,224 @@ class Music(commands.Cog):
         guild_id = interaction.guild.id
         
         # Initialize queue if not exists
-        if guild_id not in self.song_queue:
-            self.song_queue[guild_id] = []
+        queue = self.song_queue.get(guild_id)
+        if queue is None:
+            queue = self.song_queue[guild_id] = GuildQueue()
+        queue.channel = interaction.channel
 
         try:
-            # Resolve URL if not already a URL
-            if not song.startswith(('http://', 'https://')):
-                search_results = await self.search_songs(song)
-                if not search_results:
-                    await interaction.followup.send("No songs found.")
-                    return
-                song = search_results[0]['url']
-
-            # Get audio source
-            audio_source = await self.get_audio_source(song)
-            if not audio_source:
-                await interaction.followup.send("Could not retrieve audio source.")
+            # Reuse a cached search for this query so only the chosen song is extracted
+            if not is_url(song):
+                cached = search_cache.get_results(song)
+                if cached:
+                    song = cached[0]['url']
+
+            # Resolve the URL or search query with a single extraction
+            track = await self.resolver.resolve_track(song, guild_id=guild_id)
+            if not track:
+                await interaction.followup.send("No songs found.")
                 return
 
-            # Add to queue
-            title = await self.get_song_title(song)
-            self.song_queue[guild_id].append((audio_source, title))
+            # Queue the lightweight track; its audio source is only built when it starts playing
+            queue.append(track)
 
-            # If only one song in queue, start playing
-            if len(self.song_queue[guild_id]) == 1:
-                await self.play_next_song(interaction)
+            # If nothing is playing, start playing
+            if queue.current is None:
+                await self.play_next_song(guild_id, interaction)
             else:
-                await interaction.followup.send(f"Added to queue: {title}")
+                await interaction.followup.send(f"Added to queue: {track.title} ({track.duration_text})")
+                if len(queue) == 1:
+                    self.prefetch_next(guild_id)
 
         except Exception as e:
             await interaction.followup.send(f"An error occurred: {str(e)}")
             print(traceback.format_exc())
 
-    async def get_song_title(self, url):
-        """Retrieve song title."""
-        try:
-            with YoutubeDL({'quiet': True}) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info.get('title', 'Unknown Title')
-        except:
-            return 'Unknown Title'
-
-    async def play_next_song(self, interaction):
-        """Play the next song in the queue."""
-        # Check if interaction has guild context
+    @nextcord.slash_command(name="playlist", description="Queue every song in a playlist.")
+    async def play_playlist(
+        self,
+        interaction: Interaction,
+        url: str = SlashOption(description="URL of the playlist to import")
+    ):
+        """Stream playlist entries into the queue, starting playback with the first one."""
         if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=True)
             return
-            
-        guild_id = interaction.guild.id
-        
-        if not self.song_queue.get(guild_id):
+
+        if not is_url(url):
+            await interaction.response.send_message("Please provide a playlist URL.", ephemeral=True)
             return
 
-        voice_client = self.voice_clients.get(guild_id)
+        await interaction.response.defer(ephemeral=False)
+
+        voice_client = await self.connect_to_voice(interaction)
         if not voice_client:
             return
 
-        # Get next song
-        audio_source, title = self.song_queue[guild_id][0]
+        guild_id = interaction.guild.id
+        queue = self.song_queue.get(guild_id)
+        if queue is None:
+            queue = self.song_queue[guild_id] = GuildQueue()
+        queue.channel = interaction.channel
+
+        queued = 0
+        started = False
+        entries = self.resolver.iter_playlist(url, guild_id=guild_id)
+        try:
+            async for entry in entries:
+                # Stop importing if /stop tore the session down meanwhile
+                if self.song_queue.get(guild_id) is not queue:
+                    break
+
+                track = Track.from_entry(entry)
+                if track is None:
+                    continue
+                queue.append(track)
+                queued += 1
+
+                if queue.current is None:
+                    started = True
+                    await self.play_next_song(guild_id, interaction)
+                elif len(queue) == 1:
+                    self.prefetch_next(guild_id)
+        except Exception as e:
+            print(traceback.format_exc())
+            if not queued:
+                await interaction.followup.send(f"An error occurred: {str(e)}")
+                return
+        finally:
+            # Stops the worker from paging through the rest of the playlist
+            await entries.aclose()
+
+        if not queued:
+            await interaction.followup.send("No songs found in that playlist.")
+        elif started:
+            await interaction.channel.send(f"Queued {queued} songs from the playlist.")
+        else:
+            await interaction.followup.send(f"Queued {queued} songs from the playlist.")
+
+    async def play_next_song(self, guild_id, interaction=None):
+        """
+        Advance the guild's queue and play the next song.
+
+        The "Now playing" message answers `interaction` when given, otherwise it
+        goes to the text channel the songs were queued from.
+        """
+        queue = self.song_queue.get(guild_id)
+        if queue is None:
+            return
+
+        async def announce(message):
+            try:
+                if interaction is not None:
+                    await interaction.followup.send(message)
+                elif queue.channel is not None:
+                    await queue.channel.send(message)
+            except nextcord.HTTPException:
+                print(traceback.format_exc())
+
+        while True:
+            track = queue.advance()
+            if track is None:
+                return
+
+            # Play from the Opus cache if possible, otherwise make sure the stream URL is still valid
+            try:
+                cached_path = self.audio_cache.lookup(track) if self.audio_cache else None
+                if not cached_path:
+                    await self.ensure_stream(guild_id, track)
+                audio_source = self.create_audio_source(track, cached_path)
+                break
+            except Exception:
+                print(f"Error resolving {track}: {traceback.format_exc()}")
+                # /stop may have torn the session down while resolving; don't keep working through its queue
+                if self.song_queue.get(guild_id) is not queue or queue.current is not track:
+                    return
+                await announce(f"Could not retrieve audio source for {track.title}, skipping.")
+
+        # /stop may have torn the session down while the stream was resolving
+        if self.song_queue.get(guild_id) is not queue or queue.current is not track:
+            return
+
+        voice_client = self.voice_sessions.get(guild_id)
+        if not voice_client:
+            queue.clear()
+            return
 
         def after_playing(error):
-            if error:
-                print(f"Playback error: {error}")
-            
-            # Remove the current song from queue
-            if guild_id in self.song_queue:
-                self.song_queue[guild_id].pop(0)
-            
-            # Play next song
-            if self.song_queue.get(guild_id):
-                asyncio.run_coroutine_threadsafe(
-                    self.play_next_song(interaction), 
-                    self.bot.loop
-                )
+            # Runs on the voice thread; hand off to the event loop instead of touching the queue here
+            self.bot.loop.call_soon_threadsafe(dispatch_track_end, self.bot, guild_id, track, error)
 
         try:
             voice_client.play(audio_source, after=after_playing)
-            await interaction.followup.send(f"Now playing: {title}")
+            session = self.voice_sessions.session(guild_id)
+            session.tracks_played += 1
+            session.touch()
+            if self.audio_cache and not cached_path:
+                self.audio_cache.record_play(track, self.ffmpeg_path)
+            self.prefetch_next(guild_id)
+            await announce(f"Now playing: {track.title} ({track.duration_text})")
         except Exception as e:
-            await interaction.followup.send(f"Error playing song: {str(e)}")
+            queue.current = None
+            await announce(f"Error playing song: {str(e)}")
             print(traceback.format_exc())
 
+    def on_track_end(self, guild_id, track, error):
+        """Called on the event loop when a track stops, whether it finished or was skipped."""
+        if error:
+            print(f"Playback error: {error}")
+
+        # The idle timer counts from the end of the last song
+        session = self.voice_sessions.session(guild_id)
+        if session is not None:
+            session.touch()
+
+        # Ignore callbacks from a track that is no longer current (e.g. after /stop)
+        queue = self.song_queue.get(guild_id)
+        if queue is None or queue.current is not track:
+            return
+        asyncio.ensure_future(self.play_next_song(guild_id))
+
+    async def ensure_stream(self, guild_id, track):
+        """Resolve the track's stream URL if it is missing or expired, reusing a pending prefetch."""
+        prefetch = self.prefetch_tasks.get(guild_id)
+        if prefetch and prefetch[0] is track and not prefetch[1].done():
+            await asyncio.wait([prefetch[1]])
+        if track.is_expired:
+            await self.resolver.refresh_track(track, guild_id=guild_id)
+
+    def prefetch_next(self, guild_id):
+        """Resolve the stream of the song after the current one while the current one plays."""
+        queue = self.song_queue.get(guild_id)
+        if queue is None or queue.current is None or not len(queue):
+            return
+        current, upcoming = queue.current, queue.peek()
+        prefetch = self.prefetch_tasks.get(guild_id)
+        if prefetch and prefetch[0] is upcoming:
+            return
+
+        # The upcoming stream has to stay valid until the current song ends
+        if not upcoming.expires_within((current.duration or 0) + 60):
+            return
+
+        async def prefetch_stream():
+            try:
+                await self.resolver.refresh_track(upcoming, guild_id=guild_id)
+            except Exception:
+                print(f"Error prefetching {upcoming}: {traceback.format_exc()}")
+            finally:
+                pending = self.prefetch_tasks.get(guild_id)
+                if pending and pending[0] is upcoming:
+                    del self.prefetch_tasks[guild_id]
+
+        self.cancel_prefetch(guild_id)
+        self.prefetch_tasks[guild_id] = (upcoming, asyncio.ensure_future(prefetch_stream()))
+
+    def cancel_prefetch(self, guild_id):
+        prefetch = self.prefetch_tasks.pop(guild_id, None)
+        if prefetch and not prefetch[1].done():
+            prefetch[1].cancel()
+
     @play_music.on_autocomplete("song")
     async def song_autocomplete(self, interaction: Interaction, query: str):
         """Provide autocomplete suggestions for the song name."""
@@ -208,8 +409,23 @@ class Music(commands.Cog):
             await interaction.response.send_autocomplete([])
             return
 
-        results = await self.search_songs(query)
-        suggestions = [result["title"] for result in results[:10]]
+        guild_id = interaction.guild.id if interaction.guild else None
+
+        def cached_results(text):
+            # Only reached after the lookup below already counted this query
+            return search_cache.get_results(text, allow_prefix=True, count=False) or []
+
+        # Answer straight from memory when possible, otherwise debounce the search
+        results = search_cache.get_results(query, allow_prefix=True)
+        if results is None:
+            results = await self.autocomplete.run(
+                interaction.user.id,
+                query,
+                lambda text: self.search_songs(text, guild_id=guild_id, count=False),
+                cached_results
+            )
+        # Send the URL as the choice value so /play does not have to search again
+        suggestions = {result["title"][:100]: result["url"] for result in results[:10] if len(result["url"]) <= 100}
         await interaction.response.send_autocomplete(suggestions)
 
     @nextcord.slash_command(name="stop", description="Stop the music and leave the voice channel.")
@@ -221,20 +437,8 @@ class Music(commands.Cog):
             
         guild_id = interaction.guild.id
 
-        if guild_id in self.voice_clients:
-            voice_client = self.voice_clients[guild_id]
-            # Clear the queue
-            self.song_queue[guild_id] = []
-            
-            # Stop playing and disconnect
-            if voice_client.is_playing():
-                voice_client.stop()
-            
-            await voice_client.disconnect()
-            
-            # Remove from tracked voice clients
-            del self.voice_clients[guild_id]
-            
+        # Clear the queue, stop playing and disconnect
+        if await self.close_session(guild_id):
             await interaction.response.send_message("Stopped playback and disconnected from voice channel.")
         else:
             await interaction.response.send_message("I am not connected to any voice channel.", ephemeral=True)
@@ -248,28 +452,156 @@ class Music(commands.Cog):
             
         guild_id = interaction.guild.id
 
-        if guild_id not in self.voice_clients:
+        voice_client = self.voice_sessions.get(guild_id)
+        if not voice_client:
             await interaction.response.send_message("I am not connected to any voice channel.", ephemeral=True)
             return
 
-        voice_client = self.voice_clients[guild_id]
-
         if not voice_client.is_playing():
             await interaction.response.send_message("No song is currently playing.", ephemeral=True)
             return
 
-        # Stop current song
+        # Stopping the player fires its after callback, which advances the queue
+        queue = self.song_queue.get(guild_id)
         voice_client.stop()
 
-        # Remove current song from queue
-        if guild_id in self.song_queue and self.song_queue[guild_id]:
-            self.song_queue[guild_id].pop(0)
-
-        # Play next song if available
-        if self.song_queue.get(guild_id):
-            await self.play_next_song(interaction)
+        if queue is not None and len(queue):
+            await interaction.response.send_message(f"Skipped. Up next: {queue.peek().title}")
         else:
             await interaction.response.send_message("No more songs in the queue.")
 
+    @nextcord.slash_command(name="queue", description="Show the songs waiting to be played.")
+    async def show_queue(self, interaction: Interaction):
+        if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=True)
+            return
+
+        queue = self.song_queue.get(interaction.guild.id)
+        if queue is None or queue.is_idle:
+            await interaction.response.send_message("The queue is empty.", ephemeral=True)
+            return
+
+        lines = []
+        if queue.current is not None:
+            lines.append(f"**Now playing:** {queue.current.title} ({queue.current.duration_text})")
+        for position, track in enumerate(itertools.islice(queue, 10), start=1):
+            lines.append(f"`{position}.` {track.title} ({track.duration_text})")
+        if len(queue) > 10:
+            lines.append(f"...and {len(queue) - 10} more")
+        await interaction.response.send_message("\n".join(lines))
+
+    @nextcord.slash_command(name="shuffle", description="Shuffle the songs waiting to be played.")
+    async def shuffle_queue(self, interaction: Interaction):
+        if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=True)
+            return
+
+        queue = self.song_queue.get(interaction.guild.id)
+        if queue is None or len(queue) < 2:
+            await interaction.response.send_message("Not enough songs in the queue to shuffle.", ephemeral=True)
+            return
+
+        self.cancel_prefetch(interaction.guild.id)
+        queue.shuffle()
+        self.prefetch_next(interaction.guild.id)
+        await interaction.response.send_message(f"Shuffled {len(queue)} songs.")
+
+    @nextcord.slash_command(name="move", description="Move a queued song to another position.")
+    async def move_song(
+        self,
+        interaction: Interaction,
+        position: int = SlashOption(description="Current position of the song in /queue", min_value=1),
+        new_position: int = SlashOption(description="Position to move the song to", min_value=1)
+    ):
+        if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=True)
+            return
+
+        queue = self.song_queue.get(interaction.guild.id)
+        if queue is None or position > len(queue):
+            await interaction.response.send_message("There is no song at that position.", ephemeral=True)
+            return
+
+        track = queue.move(position - 1, min(new_position, len(queue)) - 1)
+        self.prefetch_next(interaction.guild.id)
+        await interaction.response.send_message(f"Moved {track.title} to position {min(new_position, len(queue))}.")
+
+    @nextcord.slash_command(name="remove", description="Remove a song from the queue.")
+    async def remove_song(
+        self,
+        interaction: Interaction,
+        position: int = SlashOption(description="Position of the song in /queue", min_value=1)
+    ):
+        if not interaction.guild:
+            await interaction.response.send_message("This command can only be used in a server, not in DMs.", ephemeral=True)
+            return
+
+        queue = self.song_queue.get(interaction.guild.id)
+        if queue is None or position > len(queue):
+            await interaction.response.send_message("There is no song at that position.", ephemeral=True)
+            return
+
+        track = queue.remove(position - 1)
+        self.prefetch_next(interaction.guild.id)
+        await interaction.response.send_message(f"Removed {track.title} from the queue.")
+
+    @nextcord.slash_command(name="voicestats", description="Show resource usage of the bot's voice sessions.")
+    async def voice_stats(self, interaction: Interaction):
+        if interaction.user.id != ALLOWED_USER_ID:
+            await interaction.response.send_message("You are not authorized to use this command.", ephemeral=True)
+            return
+
+        embed = nextcord.Embed(
+            title="Voice Sessions",
+            description=f"{len(self.voice_sessions)} sessions in this bot, "
+                        f"{self.voice_sessions.limit.in_use}/{self.voice_sessions.max_sessions} in the process, "
+                        f"idle timeout {self.voice_sessions.idle_timeout}s",
+            color=nextcord.Color.blue()
+        )
+
+        for session in itertools.islice(self.voice_sessions, 20):
+            guild = self.bot.get_guild(session.guild_id)
+            queue = self.song_queue.get(session.guild_id)
+            source = session.voice_client.source
+            process = getattr(source, "_process", None)
+            embed.add_field(
+                name=guild.name if guild else str(session.guild_id),
+                value=(
+                    f"State: {'playing' if session.is_busy else 'idle'}"
+                    f"{'' if session.is_connected else ' (disconnected)'}\n"
+                    f"Uptime: {session.uptime / 60:.0f} min, idle {session.idle_seconds:.0f}s\n"
+                    f"Listeners: {session.listeners}, tracks played: {session.tracks_played}\n"
+                    f"Queued: {len(queue) if queue else 0}, reconnects: {session.reconnects}\n"
+                    f"Source: {type(source).__name__ if source else 'none'}"
+                    f"{f' (ffmpeg pid {process.pid})' if process else ''}\n"
+                    f"Latency: {session.voice_client.latency * 1000:.0f} ms"
+                ),
+                inline=True
+            )
+        if len(self.voice_sessions) > 20:
+            embed.set_footer(text=f"...and {len(self.voice_sessions) - 20} more sessions")
+
+        resolver = self.resolver.stats()
+        search = search_cache.stats()
+        summary = [
+            f"Resolver: {resolver['pending']} jobs from {resolver['active_guilds']} guilds on {resolver['workers']} workers, "
+            f"{resolver['listings']} playlist imports",
+            f"Search cache: {search['size']} entries, hit rate {search['hit_rate']:.0%}",
+        ]
+        if self.audio_cache:
+            opus_cache = self.audio_cache.stats()
+            summary.append(f"Opus cache: {opus_cache['files']} files, {opus_cache['bytes'] / 1024 / 1024:.0f} MiB")
+        if os.path.isdir("/proc/self/fd"):
+            summary.append(f"Open file descriptors: {len(os.listdir('/proc/self/fd'))}")
+        embed.add_field(name="Process", value="\n".join(summary), inline=False)
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+def dispatch_track_end(bot, guild_id, track, error):
+    # Look the cog up when the track ends, so a hot-reloaded cog handles tracks its predecessor started
+    cog = bot.get_cog("Music")
+    if cog is not None:
+        cog.on_track_end(guild_id, track, error)
+
 def setup(bot):
     bot.add_cog(Music(bot))
\ No newline at end of file
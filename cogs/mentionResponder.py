@@ -2,9 +2,24 @@ import nextcord
 from nextcord.ext import commands
 import random
 import asyncio
+import io
 import json
 import os
+import re
 from config import  ALLOWED_USER_IDS  # Import allowed guilds, channels, and user IDs
+from utils.media_index import MediaIndex
+from utils.reply_scheduler import ReplyScheduler
+
+# Trigger phrases
+IMAGE_TRIGGER_PHRASE = "bokettoo said that you should send nudes"
+AUDIO_TRIGGER_PHRASE = "bokettoo said play some music"
+
+# One case-insensitive pass over the message finds every trigger, instead of
+# lowercasing the content and scanning it once per phrase
+TRIGGER_PATTERN = re.compile(
+    "|".join(re.escape(phrase) for phrase in (IMAGE_TRIGGER_PHRASE, AUDIO_TRIGGER_PHRASE)),
+    re.IGNORECASE
+)
 
 class MentionResponder(commands.Cog):
     def __init__(self, bot):
@@ -12,6 +27,14 @@ class MentionResponder(commands.Cog):
         self.default_responses = self.load_responses("responses.json")
         self.image_folder = 'images'  # Define your image folder path here
         self.audio_folder = 'audio'   # Define your audio folder path here
+        self.images = MediaIndex(self.image_folder, ['.png', '.jpg', '.jpeg', '.gif'])
+        self.audio = MediaIndex(self.audio_folder, ['.mp3', '.wav'])
+        self.allowed_user_ids = frozenset(ALLOWED_USER_IDS)
+        # Mentions are answered after a 5 second typing delay, batched per channel
+        self.replies = ReplyScheduler(self.send_default_response, delay=5)
+
+    def cog_unload(self):
+        self.replies.cancel()
 
     def load_responses(self, file_path):
         with open(file_path, "r", encoding="utf-8") as file:
@@ -23,31 +46,30 @@ class MentionResponder(commands.Cog):
         if message.author.bot:
             return
 
-        # Define trigger phrases
-        image_trigger_phrase = "bokettoo said that you should send nudes"
-        audio_trigger_phrase = "bokettoo said play some music"
-
-
+        # Fast path: most messages neither contain a trigger nor mention the bot
+        triggers = {phrase.lower() for phrase in TRIGGER_PATTERN.findall(message.content)}
+        if not triggers and self.bot.user not in message.mentions:
+            return
 
         # Check for image and audio trigger phrases
-        if any(trigger in message.content.lower() for trigger in [image_trigger_phrase, audio_trigger_phrase]):
+        if triggers:
             # Only proceed if user is allowed
-            if message.author.id in ALLOWED_USER_IDS:
-                if image_trigger_phrase in message.content.lower():
-                    image_file = self.get_random_file(self.image_folder, ['.png', '.jpg', '.jpeg', '.gif'])
+            if message.author.id in self.allowed_user_ids:
+                if IMAGE_TRIGGER_PHRASE in triggers:
+                    image_file = self.images.pick()
                     if image_file:
                         await message.delete()
                         await asyncio.sleep(3)
-                        await message.channel.send(file=nextcord.File(image_file))
+                        await message.channel.send(file=self.load_file(self.images, image_file))
                     else:
                         await message.channel.send("No images available.")
 
-                elif audio_trigger_phrase in message.content.lower():
-                    audio_file = self.get_random_file(self.audio_folder, ['.mp3', '.wav'])
+                elif AUDIO_TRIGGER_PHRASE in triggers:
+                    audio_file = self.audio.pick()
                     if audio_file:
                         await message.delete()
                         await asyncio.sleep(3)
-                        await message.channel.send(file=nextcord.File(audio_file))
+                        await message.channel.send(file=self.load_file(self.audio, audio_file))
                     else:
                         await message.channel.send("No audio files available.")
             
@@ -56,23 +78,18 @@ class MentionResponder(commands.Cog):
 
         # General mention response (without restrictions for ALLOWED_USER_IDS)
         if self.bot.user in message.mentions:
-            async with message.channel.typing():
-                await asyncio.sleep(5)  # Delay of 5 seconds
+            self.replies.submit(message)
 
-            response = random.choice(self.default_responses)
-            await message.reply(response)
+    async def send_default_response(self, message):
+        response = random.choice(self.default_responses)
+        await message.reply(response)
 
-    def get_random_file(self, folder_path, extensions):
-        try:
-            files = os.listdir(folder_path)
-            files = [file for file in files if any(file.endswith(ext) for ext in extensions)]
-            if files:
-                return os.path.join(folder_path, random.choice(files))
-            else:
-                return None
-        except Exception as e:
-            print(f"Error retrieving files from {folder_path}: {e}")
-            return None
+    def load_file(self, index, path):
+        # Small assets come from the index's in-memory cache; large ones are streamed from disk
+        data = index.read(path)
+        if data is None:
+            return nextcord.File(path)
+        return nextcord.File(io.BytesIO(data), filename=os.path.basename(path))
 
 def setup(bot):
     bot.add_cog(MentionResponder(bot))
@@ -66,6 +66,13 @@ class ShellCog(commands.Cog):
 
         self.current_working_directories = {}
 
+    def export_state(self):
+        """Per-channel working directories, kept across a hot reload (see utils.hot_reload)."""
+        return {"current_working_directories": self.current_working_directories}
+
+    def import_state(self, state):
+        self.current_working_directories = state["current_working_directories"]
+
     async def _run_command(self, command: str, cwd: str) -> tuple[str, str, int]:
         """
         Runs a command with a specified current working directory.
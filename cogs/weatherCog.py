@@ -1,16 +1,20 @@
 import nextcord
 from nextcord.ext import commands
-import http.client
-import json
+from utils.http_client import get_http_pool
+from utils.weather_client import get_weather_client
 
 class WeatherCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.weather = get_weather_client(get_http_pool(bot))
+
+    def cog_unload(self):
+        self.weather.close()
     
     @nextcord.slash_command(name="weather")
     async def get_weather(self, interaction: nextcord.Interaction, city: str):
         await interaction.response.defer()
-        weather_data, error = self.get_weather_data(city)
+        weather_data, error = await self.weather.get_weather(city)
         if error:
             await interaction.followup.send(error)
         elif weather_data is None:
@@ -30,35 +34,6 @@ class WeatherCog(commands.Cog):
 
             await interaction.followup.send(embed=embed)
 
-    def get_weather_data(self, city):
-        try:
-            # Geocoding API request
-            conn = http.client.HTTPSConnection("geocoding-api.open-meteo.com")
-            conn.request("GET", f"/v1/search?name={city}")
-            response = conn.getresponse()
-            geocoding_data = json.loads(response.read())
-            conn.close()
-
-            if 'results' not in geocoding_data or len(geocoding_data['results']) == 0:
-                return None, "City not found!"
-
-            latitude = geocoding_data['results'][0]['latitude']
-            longitude = geocoding_data['results'][0]['longitude']
-            city_name = geocoding_data['results'][0]['name']
-
-            # Weather API request
-            conn = http.client.HTTPSConnection("api.open-meteo.com")
-            conn.request("GET", f"/v1/forecast?latitude={latitude}&longitude={longitude}&current_weather=true")
-            response = conn.getresponse()
-            weather_data = json.loads(response.read())
-            conn.close()
-
-            weather_data['city'] = city_name  # Add city name to the weather data
-
-            return weather_data, None
-        except Exception as e:
-            return None, str(e)
-
     def interpret_weather_code(self, code):
         weather_codes = {
             0: "Clear sky",
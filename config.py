@@ -53,7 +53,44 @@ def get_default_config():
         },
         "cogs": {
             "auto_load": True,
-            "cogs_directory": "./cogs"
+            "cogs_directory": "./cogs",
+            "hot_reload": False,
+            "reload_interval": 1.0
+        },
+        "music": {
+            "resolver_workers": 4,
+            "resolver_per_guild": 2,
+            "resolver_timeout": 20,
+            "search_cache_ttl": 600,
+            "search_cache_size": 512,
+            "autocomplete_debounce": 0.35,
+            "autocomplete_deadline": 2.5,
+            "playlist_limit": 500,
+            "playback_mode": "opus",
+            "audio_cache_enabled": True,
+            "audio_cache_dir": "audio_cache",
+            "audio_cache_max_mb": 1024,
+            "audio_cache_min_plays": 2,
+            "audio_cache_max_duration": 900,
+            "voice_max_sessions": 200,
+            "voice_idle_timeout": 300,
+            "voice_reap_interval": 30
+        },
+        "http": {
+            "connection_limit": 100,
+            "per_host_limit": 10,
+            "dns_cache_ttl": 300,
+            "keepalive_timeout": 30,
+            "timeout": 10
+        },
+        "weather": {
+            "geocode_cache_path": "data/geocode_cache.json",
+            "geocode_cache_size": 5000,
+            "forecast_ttl": 600
+        },
+        "matches": {
+            "feed_url": "https://streamed.su/api/matches/football/popular",
+            "refresh_seconds": 120
         },
         "logging": {
             "enabled": False,
@@ -99,6 +136,47 @@ LOADING_BAR_LENGTH = config["bot_settings"]["loading_bar_length"]
 # Cogs settings
 COGS_AUTO_LOAD = config["cogs"]["auto_load"]
 COGS_DIRECTORY = config["cogs"]["cogs_directory"]
+COGS_HOT_RELOAD = config["cogs"].get("hot_reload", False)
+COGS_RELOAD_INTERVAL = config["cogs"].get("reload_interval", 1.0)
+
+# Music settings
+MUSIC_SETTINGS = config.get("music", {})
+MUSIC_RESOLVER_WORKERS = MUSIC_SETTINGS.get("resolver_workers", 4)
+MUSIC_RESOLVER_PER_GUILD = MUSIC_SETTINGS.get("resolver_per_guild", 2)
+MUSIC_RESOLVER_TIMEOUT = MUSIC_SETTINGS.get("resolver_timeout", 20)
+MUSIC_SEARCH_CACHE_TTL = MUSIC_SETTINGS.get("search_cache_ttl", 600)
+MUSIC_SEARCH_CACHE_SIZE = MUSIC_SETTINGS.get("search_cache_size", 512)
+MUSIC_AUTOCOMPLETE_DEBOUNCE = MUSIC_SETTINGS.get("autocomplete_debounce", 0.35)
+MUSIC_AUTOCOMPLETE_DEADLINE = MUSIC_SETTINGS.get("autocomplete_deadline", 2.5)
+MUSIC_PLAYLIST_LIMIT = MUSIC_SETTINGS.get("playlist_limit", 500)
+MUSIC_PLAYBACK_MODE = MUSIC_SETTINGS.get("playback_mode", "opus")  # "opus" or "pcm"
+MUSIC_AUDIO_CACHE_ENABLED = MUSIC_SETTINGS.get("audio_cache_enabled", True)
+MUSIC_AUDIO_CACHE_DIR = MUSIC_SETTINGS.get("audio_cache_dir", "audio_cache")
+MUSIC_AUDIO_CACHE_MAX_MB = MUSIC_SETTINGS.get("audio_cache_max_mb", 1024)
+MUSIC_AUDIO_CACHE_MIN_PLAYS = MUSIC_SETTINGS.get("audio_cache_min_plays", 2)
+MUSIC_AUDIO_CACHE_MAX_DURATION = MUSIC_SETTINGS.get("audio_cache_max_duration", 900)
+MUSIC_VOICE_MAX_SESSIONS = MUSIC_SETTINGS.get("voice_max_sessions", 200)
+MUSIC_VOICE_IDLE_TIMEOUT = MUSIC_SETTINGS.get("voice_idle_timeout", 300)
+MUSIC_VOICE_REAP_INTERVAL = MUSIC_SETTINGS.get("voice_reap_interval", 30)
+
+# Shared HTTP pool settings
+HTTP_SETTINGS = config.get("http", {})
+HTTP_CONNECTION_LIMIT = HTTP_SETTINGS.get("connection_limit", 100)
+HTTP_PER_HOST_LIMIT = HTTP_SETTINGS.get("per_host_limit", 10)
+HTTP_DNS_CACHE_TTL = HTTP_SETTINGS.get("dns_cache_ttl", 300)
+HTTP_KEEPALIVE_TIMEOUT = HTTP_SETTINGS.get("keepalive_timeout", 30)
+HTTP_TIMEOUT = HTTP_SETTINGS.get("timeout", 10)
+
+# Weather settings
+WEATHER_SETTINGS = config.get("weather", {})
+WEATHER_GEOCODE_CACHE_PATH = WEATHER_SETTINGS.get("geocode_cache_path", "data/geocode_cache.json")
+WEATHER_GEOCODE_CACHE_SIZE = WEATHER_SETTINGS.get("geocode_cache_size", 5000)
+WEATHER_FORECAST_TTL = WEATHER_SETTINGS.get("forecast_ttl", 600)
+
+# Match feed settings
+MATCHES_SETTINGS = config.get("matches", {})
+MATCHES_FEED_URL = MATCHES_SETTINGS.get("feed_url", "https://streamed.su/api/matches/football/popular")
+MATCHES_REFRESH_SECONDS = MATCHES_SETTINGS.get("refresh_seconds", 120)
 
 # Shell settings
 SHELL_CHANNEL_ID = config["shell_settings"]["shell_channel_id"]
@@ -1,40 +1,21 @@
+import time
+PROCESS_START = time.perf_counter()
+
 import nextcord
 from nextcord.ext import commands
 import os
 import sys
-import time
+import json
+import argparse
 import logging
-import random
 import asyncio
-from datetime import datetime
-from config import BOT_TOKENS, COMMAND_PREFIX, DEFAULT_STATUS, DEFAULT_ACTIVITY, LOADING_BAR_DURATION, LOADING_BAR_LENGTH, COGS_DIRECTORY, LOGGING_ENABLED, LOGGING_LEVEL, LOGGING_FORMAT
-
-# Enhanced CLI libraries
-from pyfiglet import figlet_format
-from termcolor import colored
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
-from rich.table import Table
-from rich.text import Text
-from rich.live import Live
-from rich.layout import Layout
-from rich.align import Align
-from rich.columns import Columns
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-from rich.traceback import install
-from colorama import init, Fore, Back, Style
-import tqdm
-
-# Initialize colorama for cross-platform colors
-init(autoreset=True)
-
-# Install rich traceback handler
-install()
-
-# Create rich console
-console = Console()
+import signal
+from config import BOT_TOKENS, COMMAND_PREFIX, DEFAULT_STATUS, DEFAULT_ACTIVITY, COGS_DIRECTORY, COGS_HOT_RELOAD, COGS_RELOAD_INTERVAL, LOGGING_ENABLED, LOGGING_LEVEL, LOGGING_FORMAT
+from utils.http_client import HTTPPool
+from utils.cog_loader import load_cogs
+from utils.hot_reload import HotReloader
+
+# The console UI (cli.py: rich, colorama) is imported lazily, only in interactive mode
 
 # Set up logging
 if LOGGING_ENABLED:
@@ -46,326 +27,322 @@ if LOGGING_ENABLED:
             logging.StreamHandler()
         ]
     )
-    logger = logging.getLogger(__name__)
-
-class HackerCLI:
-    def __init__(self):
-        self.console = console
-        self.start_time = datetime.now()
-        
-    def clear_screen(self):
-        """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
-    
-    def matrix_effect(self, text, delay=0.03):
-        """Create a matrix-style typing effect"""
-        for char in text:
-            self.console.print(char, style="bold green", end="")
-            time.sleep(delay)
-        self.console.print()
-    
-    def hacker_banner(self):
-        """Display the main hacker-style banner"""
-        self.clear_screen()
-        
-        # ASCII art banner
-        banner_text = """
-╔══════════════════════════════════════════════════════════════════════════════╗
-║                                                                              ║
-║  ██████╗  ██████╗ ██╗  ██╗███████╗████████╗████████╗ ██████╗                 ║
-║  ██╔══██╗██╔═══██╗██║ ██╔╝██╔════╝╚══██╔══╝╚══██╔══╝██╔═══██╗                ║
-║  ██████╔╝██║   ██║█████╔╝ █████╗     ██║      ██║   ██║   ██║                ║
-║  ██╔══██╗██║   ██║██╔═██╗ ██╔══╝     ██║      ██║   ██║   ██║                ║
-║  ██████╔╝╚██████╔╝██║  ██╗███████╗   ██║      ██║   ╚██████╔╝                ║
-║  ╚═════╝  ╚═════╝ ╚═╝  ╚═╝╚══════╝   ╚═╝      ╚═╝    ╚═════╝                 ║
-║                                                                              ║
-║                    [bold red]DISCORD BOT CONTROL CENTER[/bold red]           ║
-║                                                                              ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-        """
-        
-        self.console.print(Panel(banner_text, style="bold blue"))
-        
-        # System info
-        system_info = f"""
-[bold cyan]SYSTEM STATUS:[/bold cyan] [green]ONLINE[/green]
-[bold cyan]INITIALIZATION TIME:[/bold cyan] {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}
-[bold cyan]PYTHON VERSION:[/bold cyan] {sys.version.split()[0]}
-[bold cyan]PLATFORM:[/bold cyan] {sys.platform}
-        """
-        
-        self.console.print(Panel(system_info, title="[bold red]SYSTEM INFO[/bold red]", style="cyan"))
-    
-    def loading_sequence(self, message="Initializing system", duration=3):
-        """Animated loading sequence with progress bar"""
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=self.console
-        ) as progress:
-            task = progress.add_task(message, total=100)
-            
-            for i in range(100):
-                progress.update(task, advance=1)
-                time.sleep(duration / 100)
-    
-    def matrix_loading(self, text, duration=2):
-        """Matrix-style loading animation"""
-        chars = "01"
-        for _ in range(int(duration * 20)):
-            matrix_line = "".join(random.choice(chars) for _ in range(50))
-            self.console.print(f"[green]{matrix_line}[/green]", end="\r")
-            time.sleep(0.05)
-        self.console.print()
-        self.matrix_effect(text, delay=0.02)
-    
-    def display_bot_selection(self, bot_names):
-        """Display bot selection with enhanced styling"""
-        self.console.print("\n[bold yellow]╔══════════════════════════════════════════════════════════════════════════════╗[/bold yellow]")
-        self.console.print("[bold yellow]║[/bold yellow] [bold red]AVAILABLE BOT INSTANCES[/bold red] [bold yellow]     ║[/bold yellow]")
-        self.console.print("[bold yellow]╚══════════════════════════════════════════════════════════════════════════════╝[/bold yellow]")
-        
-        table = Table(show_header=True, header_style="bold magenta", border_style="blue")
-        table.add_column("ID", style="cyan", justify="center")
-        table.add_column("Bot Name", style="green")
-        table.add_column("Status", style="yellow")
-        table.add_column("Token Status", style="red")
-        
-        for index, bot_name in enumerate(bot_names, start=1):
-            token = BOT_TOKENS.get(bot_name, "")
-            status = "🟢 READY" if token else "🔴 OFFLINE"
-            token_status = "✓ VALID" if token else "✗ MISSING"
-            
-            table.add_row(
-                str(index),
-                bot_name,
-                status,
-                token_status
-            )
-        
-        self.console.print(table)
-    
-    def get_bot_selection(self, bot_names):
-        """Get user bot selection with validation"""
-        while True:
-            try:
-                selection = Prompt.ask(
-                    "\n[bold cyan]SELECT BOT INSTANCE[/bold cyan]",
-                    choices=[str(i) for i in range(1, len(bot_names) + 1)],
-                    default="1"
-                )
-                return int(selection)
-            except KeyboardInterrupt:
-                self.console.print("\n[bold red]Operation cancelled by user[/bold red]")
-                sys.exit(0)
-    
-    def display_bot_startup(self, bot_name):
-        """Display bot startup sequence"""
-        self.console.print(f"\n[bold blue]╔══════════════════════════════════════════════════════════════════════════════╗[/bold blue]")
-        self.console.print(f"[bold blue]║[/bold blue] [bold green]INITIALIZING: {bot_name.upper()}[/bold green] [bold blue]║[/bold blue]")
-        self.console.print(f"[bold blue]╚══════════════════════════════════════════════════════════════════════════════╝[/bold blue]")
-        
-        # Matrix effect for bot name
-        self.matrix_loading(f"Loading {bot_name}...", 1.5)
-        
-        # Startup sequence
-        startup_steps = [
-            "Validating bot credentials...",
-            "Establishing Discord connection...",
-            "Loading command modules...",
-            "Initializing voice systems...",
-            "Setting up event handlers...",
-            "Configuring bot presence...",
-            "Starting bot instance..."
-        ]
-        
-        for step in startup_steps:
-            self.loading_sequence(step, 0.8)
-    
-    def display_guild_info(self, guilds):
-        """Display guild information in a styled table"""
-        if not guilds:
-            self.console.print("[yellow]No guilds connected[/yellow]")
-            return
-        
-        self.console.print(f"\n[bold green]╔══════════════════════════════════════════════════════════════════════════════╗[/bold green]")
-        self.console.print("[bold green]║[/bold green] [bold white]CONNECTED GUILDS[/bold white] [bold green]║[/bold green]")
-        self.console.print("[bold green]╚══════════════════════════════════════════════════════════════════════════════╝[/bold green]")
-        
-        table = Table(show_header=True, header_style="bold magenta", border_style="green")
-        table.add_column("Guild Name", style="cyan")
-        table.add_column("Guild ID", style="yellow")
-        table.add_column("Member Count", style="green")
-        table.add_column("Bot Permissions", style="red")
-        
-        for guild in guilds:
-            permissions = []
-            if guild.me.guild_permissions.administrator:
-                permissions.append("ADMIN")
-            if guild.me.guild_permissions.manage_channels:
-                permissions.append("MANAGE_CHANNELS")
-            if guild.me.guild_permissions.manage_messages:
-                permissions.append("MANAGE_MESSAGES")
-            
-            perm_text = ", ".join(permissions) if permissions else "BASIC"
-            
-            table.add_row(
-                guild.name,
-                str(guild.id),
-                str(guild.member_count),
-                perm_text
-            )
-        
-        self.console.print(table)
-    
-    def display_cog_loading(self, cogs_dir):
-        """Display cog loading with progress"""
-        if not os.path.exists(cogs_dir):
-            self.console.print(f"[red]Cogs directory {cogs_dir} not found![/red]")
-            return []
-        
-        initial_extensions = [f"cogs.{filename[:-3]}" for filename in os.listdir(cogs_dir) 
-                            if filename.endswith(".py") and filename != "__init__.py"]
-        
-        if not initial_extensions:
-            self.console.print("[yellow]No cogs found to load[/yellow]")
-            return []
-        
-        self.console.print(f"\n[bold blue]╔══════════════════════════════════════════════════════════════════════════════╗[/bold blue]")
-        self.console.print("[bold blue]║[/bold blue] [bold white]LOADING COMMAND MODULES[/bold white] [bold blue]║[/bold blue]")
-        self.console.print("[bold blue]╚══════════════════════════════════════════════════════════════════════════════╝[/bold blue]")
-        
-        loaded_cogs = []
-        failed_cogs = []
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=self.console
-        ) as progress:
-            task = progress.add_task("Loading cogs...", total=len(initial_extensions))
-            
-            for extension in initial_extensions:
-                progress.update(task, description=f"Loading {extension}...")
-                try:
-                    client.load_extension(extension)
-                    loaded_cogs.append(extension)
-                    progress.advance(task)
-                    time.sleep(0.3)
-                except Exception as e:
-                    failed_cogs.append((extension, str(e)))
-                    progress.advance(task)
-                    time.sleep(0.3)
-        
-        # Display results
-        if loaded_cogs:
-            self.console.print(f"\n[green]✓ Successfully loaded {len(loaded_cogs)} cogs[/green]")
-            for cog in loaded_cogs:
-                self.console.print(f"  [green]•[/green] {cog}")
-        
-        if failed_cogs:
-            self.console.print(f"\n[red]✗ Failed to load {len(failed_cogs)} cogs[/red]")
-            for cog, error in failed_cogs:
-                self.console.print(f"  [red]•[/red] {cog}: {error}")
-        
-        return loaded_cogs
-
-# Utility function for loading bar (keeping for compatibility)
-def loading_bar(duration=LOADING_BAR_DURATION, bar_length=LOADING_BAR_LENGTH):
-    for i in range(bar_length + 1):
-        percent = (i / bar_length) * 100
-        bar = "#" * i + "-" * (bar_length - i)
-        sys.stdout.write(f"\r[{bar}] {percent:.1f}%")
-        sys.stdout.flush()
-        time.sleep(duration / bar_length)
-    print()
+logger = logging.getLogger(__name__)
 
 # Set up bot intents
 intents = nextcord.Intents.all()
 intents.members = True
 intents.message_content = True 
 
-client = commands.Bot(command_prefix=COMMAND_PREFIX, intents=intents)
+# Set bot status and activity
+STATUS_MAP = {
+    "online": nextcord.Status.online,
+    "idle": nextcord.Status.idle,
+    "dnd": nextcord.Status.dnd,
+    "invisible": nextcord.Status.invisible
+}
 
-@client.event
-async def on_ready():
-    cli = HackerCLI()
-    
-    # Display bot ready message
-    cli.console.print(f"\n[bold green]╔══════════════════════════════════════════════════════════════════════════════╗[/bold green]")
-    cli.console.print(f"[bold green]║[/bold green] [bold white]BOT STATUS: ONLINE[/bold white] [bold green]║[/bold green]")
-    cli.console.print(f"[bold green]╚══════════════════════════════════════════════════════════════════════════════╝[/bold green]")
-    
-    cli.console.print(f"[bold cyan]Bot logged in as:[/bold cyan] [green]{client.user}[/green] [yellow]({client.user.id})[/yellow]")
-    
-    if LOGGING_ENABLED:
-        logger.info(f"Bot logged in as {client.user} ({client.user.id})")
-    
-    time.sleep(1)
-    
-    # Display guild information
-    cli.display_guild_info(client.guilds)
-    
-    # Create invites for guilds
-    for guild in client.guilds:
-        time.sleep(0.5)
+# Guilds whose invite is being created at the same time in the startup task
+INVITE_CONCURRENCY = 5
+
+def env_flag(name):
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+def announce(message, style=None, level=logging.INFO, headless=False):
+    """Print to the rich console in interactive mode, log in headless mode."""
+    if headless:
+        logger.log(level, message)
+    else:
+        from cli import console
+        console.print(f"[{style}]{message}[/{style}]" if style else message)
+        if LOGGING_ENABLED and level >= logging.WARNING:
+            logger.log(level, message)
+
+class Bot(commands.Bot):
+    """
+    commands.Bot for one configured bot name.
+
+    Every bot uses an HTTP pool (see utils.http_client); when several bots run in
+    one process they are given the same pool, and the runner closes it.
+    """
+
+    def __init__(self, *args, name=None, http_pool=None, headless=False, hot_reload=COGS_HOT_RELOAD, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.name = name
+        self.http_pool = http_pool or HTTPPool()
+        self.owns_http_pool = http_pool is None
+        self.headless = headless
+        self.hot_reload = hot_reload
+        self.hot_reloader = None
+        self.startup_task = None
+        self.connect_started = None
+        self.startup_timings = {}  # phase -> seconds, see log_startup_timings()
+        self.startup_report = {}  # per-cog import/setup times, see utils.cog_loader
+
+    async def close(self):
+        if self.hot_reloader is not None:
+            self.hot_reloader.stop()
+        await super().close()
+        if self.owns_http_pool:
+            await self.http_pool.close()
+
+    def announce(self, message, style=None, level=logging.INFO):
+        announce(f"[{self.name}] {message}", style, level, self.headless)
+
+    def record_timing(self, phase, started):
+        self.startup_timings[phase] = round(time.perf_counter() - started, 3)
+
+    def log_startup_timings(self):
+        timings = dict(self.startup_timings, total=round(time.perf_counter() - PROCESS_START, 3))
+        logger.info(f"startup timings {json.dumps({'bot': self.name, **timings})}")
+
+    def load_cogs(self):
+        started = time.perf_counter()
+        if self.headless:
+            loaded = [entry["name"] for entry in load_cogs(self, COGS_DIRECTORY) if entry["error"] is None]
+        else:
+            from cli import HackerCLI
+            loaded = HackerCLI().display_cog_loading(self, COGS_DIRECTORY)
+        self.record_timing("cogs", started)
+        return loaded
+
+    async def on_ready(self):
+        # on_ready fires again after every gateway reconnect; the startup work only runs once
+        if self.startup_task is not None:
+            if LOGGING_ENABLED:
+                logger.info(f"Reconnected as {self.user}")
+            return
+        if self.connect_started is not None:
+            self.record_timing("connect", self.connect_started)
+        self.startup_task = asyncio.create_task(self.run_startup_tasks())
+        if self.hot_reload:
+            self.hot_reloader = HotReloader(self, COGS_DIRECTORY, COGS_RELOAD_INTERVAL)
+            self.hot_reloader.start()
+
+    async def create_guild_invite(self, guild, semaphore):
+        """Create a single-use invite for the first text channel that allows it."""
         for channel in guild.text_channels:
             if channel.permissions_for(guild.me).create_instant_invite:
-                try:
-                    invite = await channel.create_invite(max_uses=1, max_age=86400, unique=True)
-                    cli.console.print(f"[yellow]Invite for {guild.name}:[/yellow] [cyan]{invite.url}[/cyan]")
-                    time.sleep(0.5)
-                except Exception as e:
-                    cli.console.print(f"[red]Could not create invite for {guild.name}: {e}[/red]")
-                    if LOGGING_ENABLED:
-                        logger.error(f"Could not create invite for {guild.name}: {e}")
-                    time.sleep(0.5)
-                break
-
-    # Set bot status and activity
-    status_map = {
-        "online": nextcord.Status.online,
-        "idle": nextcord.Status.idle,
-        "dnd": nextcord.Status.dnd,
-        "invisible": nextcord.Status.invisible
-    }
-    
-    status = status_map.get(DEFAULT_STATUS, nextcord.Status.idle)
-    await client.change_presence(activity=nextcord.Game(name=DEFAULT_ACTIVITY), status=status)
-    
-    cli.console.print(f"\n[bold green]Bot is now ready and listening for commands![/bold green]")
+                async with semaphore:
+                    try:
+                        invite = await channel.create_invite(max_uses=1, max_age=86400, unique=True)
+                        self.announce(f"Invite for {guild.name}: {invite.url}", "yellow")
+                    except Exception as e:
+                        self.announce(f"Could not create invite for {guild.name}: {e}", "red", logging.ERROR)
+                return
+
+    async def run_startup_tasks(self):
+        """One-time work after the first READY, run as a task so the gateway keeps being serviced."""
+        started = time.perf_counter()
+
+        if self.headless:
+            logger.info(f"[{self.name}] Bot logged in as {self.user} ({self.user.id}), {len(self.guilds)} guilds")
+        else:
+            from cli import HackerCLI
+            cli = HackerCLI()
+
+            # Display bot ready message
+            cli.console.print(f"\n[bold green]╔══════════════════════════════════════════════════════════════════════════════╗[/bold green]")
+            cli.console.print(f"[bold green]║[/bold green] [bold white]BOT STATUS: ONLINE[/bold white] [bold green]║[/bold green]")
+            cli.console.print(f"[bold green]╚══════════════════════════════════════════════════════════════════════════════╝[/bold green]")
+
+            cli.console.print(f"[bold cyan]{self.name} logged in as:[/bold cyan] [green]{self.user}[/green] [yellow]({self.user.id})[/yellow]")
+
+            if LOGGING_ENABLED:
+                logger.info(f"[{self.name}] Bot logged in as {self.user} ({self.user.id})")
+
+            # Display guild information
+            cli.display_guild_info(self.guilds)
+
+        status = STATUS_MAP.get(DEFAULT_STATUS, nextcord.Status.idle)
+
+        # Create invites for all guilds concurrently, a few at a time
+        semaphore = asyncio.Semaphore(INVITE_CONCURRENCY)
+        results = await asyncio.gather(
+            self.change_presence(activity=nextcord.Game(name=DEFAULT_ACTIVITY), status=status),
+            *(self.create_guild_invite(guild, semaphore) for guild in self.guilds),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.announce(f"Startup task failed: {result}", "red", logging.ERROR)
 
-def validate_tokens():
-    """Validate that all required bot tokens are present in environment variables"""
+        elapsed = time.perf_counter() - started
+        self.record_timing("ready_tasks", started)
+        if self.headless:
+            self.log_startup_timings()
+        else:
+            cli.console.print(f"\n[bold green]{self.name} is now ready and listening for commands![/bold green] [dim]({len(self.guilds)} guilds, startup tasks took {elapsed:.2f}s)[/dim]")
+            if LOGGING_ENABLED:
+                logger.info(f"[{self.name}] Startup tasks for {len(self.guilds)} guilds finished in {elapsed:.2f}s")
+
+def create_bot(name, http_pool=None, headless=False, hot_reload=COGS_HOT_RELOAD, loop=None):
+    """Build the bot for one configured name; pass a shared `http_pool`/`loop` to run several in one process."""
+    return Bot(
+        command_prefix=COMMAND_PREFIX,
+        intents=intents,
+        name=name,
+        http_pool=http_pool,
+        headless=headless,
+        hot_reload=hot_reload,
+        loop=loop,
+    )
+
+def parse_args(argv=None):
+    """Command line options; the environment variables cover supervisors that cannot pass arguments."""
+    parser = argparse.ArgumentParser(description="Start one or all of the configured Discord bots.")
+    parser.add_argument(
+        "--headless", action="store_true", default=env_flag("BOT_HEADLESS"),
+        help="skip the animations and the interactive prompt, log instead (env: BOT_HEADLESS=1)"
+    )
+    parser.add_argument("--bot", default=os.getenv("BOT_NAME"), help="name of the bot in BOT_TOKENS to start (env: BOT_NAME)")
+    parser.add_argument(
+        "--all", action="store_true", default=env_flag("BOT_ALL"),
+        help="run every configured bot in this process, sharing caches and connection pools (env: BOT_ALL=1)"
+    )
+    parser.add_argument(
+        "--reload", action="store_true", default=COGS_HOT_RELOAD,
+        help="reload cogs when their files change (config: cogs.hot_reload)"
+    )
+    return parser.parse_args(argv)
+
+def validate_tokens(bot_names, headless=False):
+    """Validate that the tokens of `bot_names` are present in environment variables"""
     missing_tokens = []
-    for bot_name, token in BOT_TOKENS.items():
-        if not token:
+    for bot_name in bot_names:
+        if not BOT_TOKENS.get(bot_name):
             missing_tokens.append(bot_name)
     
     if missing_tokens:
-        console.print(f"[red]Missing bot tokens for: {', '.join(missing_tokens)}[/red]")
-        console.print("[yellow]Please check your .env file and ensure all required tokens are set.[/yellow]")
-        if LOGGING_ENABLED:
-            logger.error(f"Missing bot tokens for: {', '.join(missing_tokens)}")
+        announce(f"Missing bot tokens for: {', '.join(missing_tokens)}", "red", logging.ERROR, headless)
+        announce("Please check your .env file and ensure all required tokens are set.", "yellow", headless=headless)
         return False
     return True
 
-if __name__ == "__main__":
+async def run_bot(bot):
+    """Run one bot until it disconnects for good; failures are reported for that bot only."""
+    try:
+        bot.connect_started = time.perf_counter()
+        await bot.start(BOT_TOKENS[bot.name])
+    except nextcord.LoginFailure as e:
+        bot.announce(f"Login failed: {e}", "red", logging.ERROR)
+    except Exception as e:
+        bot.announce(f"Stopped with an error: {e}", "red", logging.ERROR)
+    finally:
+        if not bot.is_closed():
+            await bot.close()
+        uptime = time.perf_counter() - bot.connect_started
+        bot.announce(f"Shut down after {uptime:.0f}s", "yellow")
+
+def cancel_remaining_tasks(loop):
+    """Cancel and wait for tasks still pending on `loop` (reapers, pollers, prefetches) before it is closed."""
+    tasks = [task for task in asyncio.all_tasks(loop) if not task.done()]
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    for task in tasks:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Task {task.get_name()} failed during shutdown: {task.exception()}")
+    loop.run_until_complete(loop.shutdown_asyncgens())
+
+def run_bots(bot_names, headless=False, hot_reload=COGS_HOT_RELOAD, timings=None):
+    """
+    Run every bot in `bot_names` on one event loop.
+
+    The bots share the HTTP pool and the process-wide caches (yt-dlp resolver,
+    search and audio caches, weather client, match feed, voice session cap);
+    each one has its own gateway connection, voice sessions, cogs, startup
+    timings and log prefix.
+
+    `timings` holds the process-wide phases measured before the bots exist
+    (imports, validate); every bot's startup timings start from a copy.
+    """
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    http_pool = HTTPPool()
+    bots = [create_bot(name, http_pool=http_pool, headless=headless, hot_reload=hot_reload, loop=loop)
+            for name in bot_names]
+
+    for bot in bots:
+        bot.startup_timings.update(timings or {})
+        bot.load_cogs()
+        logger.info(f"Starting bot: {bot.name}")
+
+    def request_shutdown(signame):
+        # Closing every bot ends its start() call, which ends the runner below
+        announce(f"Received {signame}, shutting down", "bold yellow", headless=headless)
+        for bot in bots:
+            if not bot.is_closed():
+                loop.create_task(bot.close())
+
+    # What client.run() would install; supervisors stop the process with SIGTERM
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, request_shutdown, signal.Signals(signum).name)
+        except NotImplementedError:
+            pass  # Windows: Ctrl+C arrives as KeyboardInterrupt below
+
+    runner = asyncio.gather(*(run_bot(bot) for bot in bots))
+    try:
+        loop.run_until_complete(runner)
+    except KeyboardInterrupt:
+        announce("Bot shutdown requested by user", "bold yellow", headless=headless)
+        loop.run_until_complete(asyncio.gather(*(bot.close() for bot in bots if not bot.is_closed())))
+        runner.cancel()
+        loop.run_until_complete(asyncio.gather(runner, return_exceptions=True))
+    finally:
+        loop.run_until_complete(http_pool.close())
+        # Drop queued extractions first so the tasks waiting on them end with the rest;
+        # looked up rather than imported so exiting never loads yt-dlp
+        ytdl = sys.modules.get("utils.ytdl")
+        if ytdl is not None:
+            ytdl.shutdown_resolver()
+        cancel_remaining_tasks(loop)
+        loop.close()
+
+def select_bots(args):
+    """Names of the bots to start: all of them, the one from --bot/BOT_NAME, or None to ask."""
+    bot_names = list(BOT_TOKENS.keys())
+    if args.all:
+        return bot_names
+    if args.bot:
+        if args.bot not in BOT_TOKENS:
+            announce(f"Unknown bot {args.bot!r}; configured bots: {', '.join(bot_names)}", "red", logging.ERROR,
+                     args.headless)
+            sys.exit(1)
+        return [args.bot]
+    if args.headless:
+        return bot_names[:1]
+    return None
+
+def main_headless(args):
+    """Fast start for supervised deployments: no animations, no prompt, timings go to the log."""
+    if not LOGGING_ENABLED:
+        # Logs are the only output without the console UI
+        logging.basicConfig(level=logging.INFO, format=LOGGING_FORMAT)
+
+    bot_names = select_bots(args)
+    if not bot_names:
+        logger.error("No bots found in the configuration.")
+        sys.exit(1)
+
+    timings = {"imports": round(time.perf_counter() - PROCESS_START, 3)}
+    started = time.perf_counter()
+    if not validate_tokens(bot_names, headless=True):
+        sys.exit(1)
+    timings["validate"] = round(time.perf_counter() - started, 3)
+
+    run_bots(bot_names, headless=True, hot_reload=args.reload, timings=timings)
+
+def main_interactive(args):
+    from cli import HackerCLI, console
     cli = HackerCLI()
+    timings = {"imports": round(time.perf_counter() - PROCESS_START, 3)}
     
     try:
         # Display hacker banner
         cli.hacker_banner()
         
-        # Validate tokens first
-        if not validate_tokens():
-            sys.exit(1)
-        
         bot_names = list(BOT_TOKENS.keys())
 
         if not bot_names:
@@ -374,25 +351,29 @@ if __name__ == "__main__":
                 logger.error("No bots found in the configuration.")
             sys.exit(1)
 
-        # Display bot selection
-        cli.display_bot_selection(bot_names)
-        
-        # Get user selection
-        selection = cli.get_bot_selection(bot_names)
-        selected_bot_name = bot_names[selection - 1]
+        selected_bot_names = select_bots(args)
+        if selected_bot_names is None:
+            # Display bot selection
+            cli.display_bot_selection(bot_names)
+
+            # Get user selection
+            selection = cli.get_bot_selection(bot_names)
+            selected_bot_names = [bot_names[selection - 1]]
+
+        # Validate tokens first
+        started = time.perf_counter()
+        if not validate_tokens(selected_bot_names):
+            sys.exit(1)
+        timings["validate"] = round(time.perf_counter() - started, 3)
         
         # Display bot startup sequence
-        cli.display_bot_startup(selected_bot_name)
-        
-        # Load cogs
-        loaded_cogs = cli.display_cog_loading(COGS_DIRECTORY)
+        cli.display_bot_startup(", ".join(selected_bot_names))
         
         if LOGGING_ENABLED:
-            logger.info(f"Starting bot: {selected_bot_name}")
+            logger.info(f"Starting bots: {', '.join(selected_bot_names)}")
         
-        # Start the bot
-        token = BOT_TOKENS[selected_bot_name]
-        client.run(token)
+        # Start the bots
+        run_bots(selected_bot_names, hot_reload=args.reload, timings=timings)
         
     except KeyboardInterrupt:
         console.print("\n[bold yellow]Bot shutdown requested by user[/bold yellow]")
@@ -403,3 +384,10 @@ if __name__ == "__main__":
         if LOGGING_ENABLED:
             logger.error(f"An error occurred: {e}")
         sys.exit(1)
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.headless:
+        main_headless(args)
+    else:
+        main_interactive(args)
@@ -0,0 +1,161 @@
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+
+from config import (MUSIC_AUDIO_CACHE_ENABLED, MUSIC_AUDIO_CACHE_DIR, MUSIC_AUDIO_CACHE_MAX_MB,
+                    MUSIC_AUDIO_CACHE_MIN_PLAYS, MUSIC_AUDIO_CACHE_MAX_DURATION)
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class OpusCache:
+    """
+    On-disk cache of frequently played tracks, stored as Ogg/Opus files.
+
+    A track is transcoded once it has been played `min_plays` times; later plays
+    read the file through an Opus passthrough source, so neither ffmpeg nor
+    nextcord has to encode anything. The directory is kept under `max_bytes`
+    by evicting the least recently played files (file mtimes keep that order
+    across restarts).
+    """
+
+    def __init__(self, directory=MUSIC_AUDIO_CACHE_DIR, max_bytes=MUSIC_AUDIO_CACHE_MAX_MB * 1024 * 1024,
+                 min_plays=MUSIC_AUDIO_CACHE_MIN_PLAYS, max_duration=MUSIC_AUDIO_CACHE_MAX_DURATION,
+                 max_transcodes=2):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.min_plays = min_plays
+        self.max_duration = max_duration
+        self._files = OrderedDict()  # key -> size in bytes, least recently played first
+        self._total_bytes = 0
+        self._plays = TTLCache(maxsize=4096, ttl=7 * 24 * 60 * 60)
+        self._pending = {}  # key -> transcode task
+        self._transcode_slots = asyncio.Semaphore(max_transcodes)
+        self.hits = 0
+        self.misses = 0
+        self._scan()
+
+    def _scan(self):
+        """Index files left over from previous runs, oldest first."""
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".opus"):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-5], stat.st_size))
+                elif entry.is_file() and entry.name.endswith(".part"):
+                    os.remove(entry.path)  # interrupted transcode
+        for _, key, size in sorted(found):
+            self._files[key] = size
+            self._total_bytes += size
+        self._evict()
+
+    @staticmethod
+    def key_for(track):
+        return hashlib.sha1(track.webpage_url.encode("utf-8")).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.directory, f"{key}.opus")
+
+    def lookup(self, track):
+        """Return the cached file for `track` and mark it as recently played, or None."""
+        key = self.key_for(track)
+        if key not in self._files:
+            self.misses += 1
+            return None
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self._total_bytes -= self._files.pop(key)
+            self.misses += 1
+            return None
+        self._files.move_to_end(key)
+        self.hits += 1
+        return path
+
+    def record_play(self, track, ffmpeg_path="ffmpeg"):
+        """Count a play of an uncached track and start caching it once it is popular enough."""
+        if not track.duration or track.duration > self.max_duration or not track.stream_url:
+            return
+        key = self.key_for(track)
+        if key in self._files or key in self._pending:
+            return
+        plays = self._plays.get(key, 0) + 1
+        self._plays.set(key, plays)
+        if plays >= self.min_plays:
+            task = asyncio.ensure_future(self._transcode(key, track.stream_url, ffmpeg_path))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+
+    async def _transcode(self, key, stream_url, ffmpeg_path):
+        path = self.path_for(key)
+        partial = f"{path}.part"
+        async with self._transcode_slots:
+            process = None
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    ffmpeg_path, "-nostdin", "-loglevel", "error",
+                    "-reconnect", "1", "-reconnect_streamed", "1", "-reconnect_delay_max", "5",
+                    "-i", stream_url,
+                    "-vn", "-c:a", "libopus", "-b:a", "128k", "-ar", "48000", "-ac", "2",
+                    "-f", "ogg", "-y", partial,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                _, stderr = await process.communicate()
+                if process.returncode != 0:
+                    logger.warning(f"Opus transcode failed for {key}: {stderr.decode(errors='ignore').strip()}")
+                    return
+                os.replace(partial, path)
+            except asyncio.CancelledError:
+                if process is not None and process.returncode is None:
+                    process.kill()
+                raise
+            except Exception as e:
+                logger.warning(f"Opus transcode failed for {key}: {e}")
+                return
+            finally:
+                if os.path.exists(partial):
+                    os.remove(partial)
+
+        size = os.path.getsize(path)
+        self._files[key] = size
+        self._total_bytes += size
+        self._plays.pop(key)
+        self._evict()
+        logger.info(f"Cached {key} as Opus ({size / 1024:.0f} KiB)")
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._files:
+            key, size = self._files.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(self.path_for(key))
+            except OSError:
+                pass  # already gone, or still open for playback on Windows
+
+    def stats(self):
+        return {
+            "files": len(self._files),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "transcoding": len(self._pending),
+        }
+
+
+_audio_cache = None
+
+
+def get_audio_cache():
+    """Return the process-wide Opus cache, or None when it is disabled."""
+    global _audio_cache
+    if _audio_cache is None and MUSIC_AUDIO_CACHE_ENABLED:
+        _audio_cache = OpusCache()
+    return _audio_cache
@@ -0,0 +1,66 @@
+import asyncio
+
+from config import MUSIC_AUTOCOMPLETE_DEBOUNCE, MUSIC_AUTOCOMPLETE_DEADLINE
+
+
+class AutocompleteScheduler:
+    """
+    Debounces autocomplete lookups per user.
+
+    Each keystroke waits `debounce` seconds; if the user typed again in the
+    meantime the older event is answered from `fallback` instead of searching.
+    A new search cancels the user's previous in-flight one. If a search is still
+    running when the `deadline` (Discord allows 3 seconds) is near, the
+    fallback results are sent and the search keeps running to warm the cache.
+    """
+
+    def __init__(self, debounce=MUSIC_AUTOCOMPLETE_DEBOUNCE, deadline=MUSIC_AUTOCOMPLETE_DEADLINE):
+        self.debounce = debounce
+        self.deadline = deadline
+        self._generations = {}  # user_id -> latest event number
+        self._inflight = {}  # user_id -> search task
+
+    async def run(self, user_id, query, search, fallback):
+        """
+        Return results for `query`.
+
+        `search` is a coroutine function taking the query; `fallback` is a plain
+        function returning the best cached results for it (or an empty list).
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        generation = self._generations.get(user_id, 0) + 1
+        self._generations[user_id] = generation
+
+        await asyncio.sleep(self.debounce)
+        if self._generations.get(user_id) != generation:
+            return fallback(query)
+
+        previous = self._inflight.pop(user_id, None)
+        if previous is not None and not previous.done():
+            previous.cancel()
+
+        task = asyncio.ensure_future(search(query))
+        self._inflight[user_id] = task
+        task.add_done_callback(lambda _: self._forget(user_id, generation, task))
+
+        remaining = self.deadline - (loop.time() - started)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout=max(remaining, 0))
+        except asyncio.TimeoutError:
+            return fallback(query)
+        except asyncio.CancelledError:
+            # Only the shield was cancelled here; a superseded search is cancelled by the newer event
+            if task.cancelled():
+                return fallback(query)
+            raise
+
+    def _forget(self, user_id, generation, task):
+        """Drop bookkeeping for a user once their latest search has finished."""
+        if self._inflight.get(user_id) is task:
+            del self._inflight[user_id]
+        if self._generations.get(user_id) == generation:
+            del self._generations[user_id]
+
+    def pending(self):
+        return len(self._inflight)
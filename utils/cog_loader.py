@@ -0,0 +1,150 @@
+import ast
+import importlib
+import logging
+import os
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def discover_cogs(cogs_dir):
+    """Extension names ("cogs.X") for every module in `cogs_dir`."""
+    if not os.path.exists(cogs_dir):
+        return []
+    return [f"cogs.{filename[:-3]}" for filename in sorted(os.listdir(cogs_dir))
+            if filename.endswith(".py") and filename != "__init__.py"]
+
+
+def _imported_modules(path):
+    """Absolute module names a source file imports at any level, without importing it."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError):
+        return set()
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            modules.add(node.module)
+    return modules
+
+
+def shared_dependencies(extensions, cogs_dir):
+    """Modules imported by more than one cog, in first-seen order."""
+    counts = Counter()
+    for extension in extensions:
+        counts.update(_imported_modules(os.path.join(cogs_dir, f"{extension.rsplit('.', 1)[1]}.py")))
+    return [module for module, count in counts.items() if count > 1]
+
+
+def _timed_import(extension):
+    # Thread CPU time: waiting for the GIL or for another thread's import lock is not charged to this cog
+    started = time.thread_time()
+    try:
+        importlib.import_module(extension)
+        return time.thread_time() - started, None
+    except Exception as e:
+        return time.thread_time() - started, e
+
+
+def _load_timed(bot, extension):
+    """
+    bot.load_extension(), returning (module body seconds, setup seconds).
+
+    load_extension re-executes the module from its spec, which importlib takes
+    from the already imported module; wrapping that spec's exec_module for the
+    call separates the module body from setup().
+    """
+    loader = importlib.import_module(extension).__spec__.loader
+    exec_time = [0.0]
+    exec_module = loader.exec_module
+
+    def timed_exec_module(module):
+        started = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            exec_time[0] = time.perf_counter() - started
+
+    loader.exec_module = timed_exec_module
+    started = time.perf_counter()
+    try:
+        bot.load_extension(extension)
+    finally:
+        del loader.exec_module
+    return exec_time[0], time.perf_counter() - started - exec_time[0]
+
+
+def cog_ms(entry):
+    """Total time attributed to one report entry."""
+    return entry["import_ms"] + (entry["exec_ms"] or 0) + (entry["setup_ms"] or 0)
+
+
+def load_cogs(bot, cogs_dir, workers=4, on_loaded=None):
+    """
+    Load every cog in `cogs_dir` and record how long each one took.
+
+    Dependencies used by more than one cog (nextcord, aiohttp, config, ...) are
+    imported first, on their own, so no single cog is charged for them. The cog
+    modules are then imported in parallel threads, each timed by its thread's
+    CPU time, which pulls in and byte-compiles every cog's own dependencies
+    (yt-dlp, ...) concurrently. Finally the extensions are loaded one at a time
+    with bot.load_extension, which has to stay serial because setup() touches
+    the bot; setup() is timed separately from the (now cheap) module body.
+
+    Every cog's import, module body and setup time ends up in
+    `bot.startup_report` and the log. `on_loaded(entry)` is called after each
+    cog for progress displays. Returns the list of report entries.
+    """
+    extensions = discover_cogs(cogs_dir)
+    if not extensions:
+        logger.warning(f"No cogs found in {cogs_dir}")
+        return []
+
+    started = time.perf_counter()
+    shared = shared_dependencies(extensions, cogs_dir)
+    for module in shared:
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass  # reported by the cog that imports it
+    shared_ms = round((time.perf_counter() - started) * 1000, 1)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cog-import") as executor:
+        imports = dict(zip(extensions, executor.map(_timed_import, extensions)))
+
+    report = []
+    for extension in extensions:
+        import_seconds, error = imports[extension]
+        entry = {"name": extension, "import_ms": round(import_seconds * 1000, 1), "exec_ms": None, "setup_ms": None,
+                 "error": None}
+        if error is None:
+            try:
+                exec_seconds, setup_seconds = _load_timed(bot, extension)
+                entry["exec_ms"] = round(exec_seconds * 1000, 1)
+                entry["setup_ms"] = round(setup_seconds * 1000, 1)
+            except Exception as e:
+                error = e
+        if error is not None:
+            entry["error"] = str(error) or type(error).__name__
+            logger.error(f"Failed to load {extension}: {entry['error']}")
+        else:
+            logger.info(f"Loaded {extension}: import {entry['import_ms']} ms, module body {entry['exec_ms']} ms, "
+                        f"setup {entry['setup_ms']} ms")
+        report.append(entry)
+        if on_loaded is not None:
+            on_loaded(entry)
+
+    total_ms = round((time.perf_counter() - started) * 1000, 1)
+    loaded = [entry for entry in report if entry["error"] is None]
+    if loaded:
+        slowest = max(loaded, key=cog_ms)
+        logger.info(f"Loaded {len(loaded)}/{len(report)} cogs in {total_ms} ms "
+                    f"({shared_ms} ms of it shared dependencies), "
+                    f"slowest {slowest['name']} ({cog_ms(slowest):.1f} ms)")
+    bot.startup_report = {"cogs": report, "cogs_ms": total_ms, "shared_ms": shared_ms, "shared": shared}
+    return report
@@ -0,0 +1,85 @@
+import functools
+import heapq
+import math
+import time
+
+
+class CooldownStore:
+    """
+    Per-key cooldowns that expire on their own.
+
+    Active cooldowns live in a dict (O(1) checks); a min-heap of expiry times
+    lets every call sweep out the entries that have already expired, so memory
+    only grows with the number of keys currently on cooldown.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self._expiries = {}  # key -> monotonic expiry time
+        self._heap = []  # (expiry, key), may contain stale entries for reset keys
+
+    def _sweep(self, now):
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if self._expiries.get(key) == expiry:
+                del self._expiries[key]
+
+    def remaining(self, key):
+        """Seconds left on `key`'s cooldown, 0 if it is not on cooldown."""
+        now = time.monotonic()
+        self._sweep(now)
+        expiry = self._expiries.get(key)
+        return max(expiry - now, 0.0) if expiry is not None else 0.0
+
+    def trigger(self, key, seconds=None):
+        """Start (or restart) `key`'s cooldown."""
+        expiry = time.monotonic() + (self.seconds if seconds is None else seconds)
+        self._expiries[key] = expiry
+        heapq.heappush(self._heap, (expiry, key))
+
+    def hit(self, key):
+        """
+        Check and start a cooldown in one step.
+
+        Returns 0 and starts the cooldown if `key` was free, otherwise returns
+        the seconds remaining and leaves the cooldown untouched.
+        """
+        remaining = self.remaining(key)
+        if remaining:
+            return remaining
+        self.trigger(key)
+        return 0.0
+
+    def reset(self, key):
+        self._expiries.pop(key, None)
+
+    def __len__(self):
+        self._sweep(time.monotonic())
+        return len(self._expiries)
+
+
+def cooldown(seconds, key=lambda interaction: interaction.user.id,
+             message="Please wait {remaining} seconds before using this command again."):
+    """
+    Rate-limit a cog's slash command.
+
+    Put it below the @nextcord.slash_command decorator. Callers still on cooldown
+    get `message` as an ephemeral reply. The store is available as
+    `<command callback>.cooldowns` for other code to inspect or reset.
+    """
+    store = CooldownStore(seconds)
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction, *args, **kwargs):
+            remaining = store.hit(key(interaction))
+            if remaining:
+                await interaction.response.send_message(message.format(remaining=math.ceil(remaining)), ephemeral=True)
+                return
+            return await func(self, interaction, *args, **kwargs)
+
+        wrapper.cooldowns = store
+        return wrapper
+
+    return decorator
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import os
+
+from utils.cog_loader import discover_cogs
+
+logger = logging.getLogger(__name__)
+
+
+class HotReloader:
+    """
+    Reloads cogs whose source file changed, without restarting the bot.
+
+    Polls the mtime of every file in `cogs_dir` every `interval` seconds and
+    calls bot.reload_extension for the changed ones only (new files are loaded).
+    Live state survives the reload through an explicit handoff: a cog that
+    defines export_state() gets the returned value passed to the new
+    instance's import_state(). The gateway and voice connections are never
+    touched. Only cog modules are reloaded; changes under utils/ still need a
+    restart.
+    """
+
+    def __init__(self, bot, cogs_dir, interval=1.0):
+        self.bot = bot
+        self.cogs_dir = cogs_dir
+        self.interval = interval
+        self.reloads = 0
+        self._mtimes = self._scan()
+        self._task = None
+
+    def _path(self, extension):
+        return os.path.join(self.cogs_dir, f"{extension.rsplit('.', 1)[1]}.py")
+
+    def _scan(self):
+        mtimes = {}
+        for extension in discover_cogs(self.cogs_dir):
+            try:
+                mtimes[extension] = os.stat(self._path(extension)).st_mtime_ns
+            except OSError:
+                pass  # deleted between listing and stat
+        return mtimes
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+            logger.info(f"Watching {self.cogs_dir} for changes")
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            mtimes = self._scan()
+            changed = [extension for extension, mtime in mtimes.items() if self._mtimes.get(extension) != mtime]
+            self._mtimes = mtimes
+            for extension in changed:
+                await self.reload(extension)
+
+    async def reload(self, extension):
+        """Reload (or load) `extension`, handing live cog state over to the new instances."""
+        if extension not in self.bot.extensions:
+            try:
+                self.bot.load_extension(extension)
+                logger.info(f"Loaded new cog {extension}")
+            except Exception as e:
+                logger.error(f"Failed to load {extension}: {e}")
+                return
+        else:
+            states = {}
+            for name, cog in self.bot.cogs.items():
+                if cog.__module__ == extension and hasattr(cog, "export_state"):
+                    states[name] = cog.export_state()
+
+            try:
+                self.bot.reload_extension(extension)
+                logger.info(f"Reloaded {extension}")
+            except Exception as e:
+                # nextcord puts the previous version back; its fresh instances still get the state
+                logger.error(f"Failed to reload {extension}, kept the previous version: {e}")
+            finally:
+                for name, state in states.items():
+                    cog = self.bot.get_cog(name)
+                    if cog is not None and hasattr(cog, "import_state"):
+                        cog.import_state(state)
+
+        self.reloads += 1
+        try:
+            # Point Discord's command ids at the new callbacks; only changed commands are re-registered
+            await self.bot.sync_all_application_commands()
+        except Exception as e:
+            logger.warning(f"Could not sync application commands after reloading {extension}: {e}")
@@ -0,0 +1,91 @@
+import logging
+
+import aiohttp
+
+from config import (HTTP_CONNECTION_LIMIT, HTTP_PER_HOST_LIMIT, HTTP_DNS_CACHE_TTL, HTTP_KEEPALIVE_TIMEOUT,
+                    HTTP_TIMEOUT)
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPPool:
+    """
+    One pooled aiohttp session shared by every cog.
+
+    Connections are kept alive and reused per host, DNS answers are cached, and
+    every request has a total timeout, so no cog pays a fresh TLS handshake or
+    hangs on a slow API. The session is created lazily on first use because
+    aiohttp needs a running event loop.
+    """
+
+    def __init__(self, limit=HTTP_CONNECTION_LIMIT, limit_per_host=HTTP_PER_HOST_LIMIT,
+                 dns_cache_ttl=HTTP_DNS_CACHE_TTL, keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT, timeout=HTTP_TIMEOUT):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def get_json(self, url, **kwargs):
+        """
+        GET `url` and return (status, parsed JSON).
+
+        The JSON is None for non-200 responses. Network errors and timeouts
+        propagate as aiohttp.ClientError / asyncio.TimeoutError.
+        """
+        async with self.session.get(url, **kwargs) as response:
+            if response.status != 200:
+                logger.warning(f"GET {url} returned HTTP {response.status}")
+                return response.status, None
+            return response.status, await response.json(content_type=None)
+
+    async def get_json_conditional(self, url, etag=None, last_modified=None, **kwargs):
+        """
+        Conditional GET using If-None-Match / If-Modified-Since.
+
+        Returns (status, parsed JSON, etag, last_modified). The JSON is None when
+        the server answers 304 Not Modified or with an error status.
+        """
+        headers = dict(kwargs.pop("headers", None) or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        async with self.session.get(url, headers=headers, **kwargs) as response:
+            etag = response.headers.get("ETag", etag)
+            last_modified = response.headers.get("Last-Modified", last_modified)
+            if response.status != 200:
+                if response.status != 304:
+                    logger.warning(f"GET {url} returned HTTP {response.status}")
+                return response.status, None, etag, last_modified
+            return response.status, await response.json(content_type=None), etag, last_modified
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+def get_http_pool(bot):
+    """Return the bot's shared HTTP pool, attaching one if the bot was created without it."""
+    pool = getattr(bot, "http_pool", None)
+    if pool is None:
+        pool = bot.http_pool = HTTPPool()
+    return pool
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+import time
+
+import aiohttp
+
+from config import MATCHES_FEED_URL, MATCHES_REFRESH_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class MatchFeed:
+    """
+    Snapshot of the match feed, refreshed in the background.
+
+    The feed is polled every `interval` seconds with a conditional GET, so an
+    unchanged feed costs a 304 and nothing else. `version` goes up whenever new
+    matches arrive, which lets readers rebuild what they derive from them only
+    when needed. Polling runs while at least one user holds the feed
+    (acquire()/release()), so every MatchCog in the process reads the same
+    snapshot and the feed is fetched once, not once per bot.
+    """
+
+    def __init__(self, http, url=MATCHES_FEED_URL, interval=MATCHES_REFRESH_SECONDS):
+        self.http = http
+        self.url = url
+        self.interval = interval
+        self.matches = None
+        self.updated_at = None
+        self.version = 0
+        self.ready = asyncio.Event()
+        self._etag = None
+        self._last_modified = None
+        self._users = 0
+        self._task = None
+
+    def acquire(self):
+        self._users += 1
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    def release(self):
+        self._users -= 1
+        if self._users <= 0 and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                # A bad poll must not end polling; the previous snapshot stays in place
+                logger.exception("Match feed refresh failed")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self):
+        """Poll the feed once; the snapshot only changes when the feed did."""
+        try:
+            status, matches, self._etag, self._last_modified = await self.http.get_json_conditional(
+                self.url, etag=self._etag, last_modified=self._last_modified
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            # ValueError: a 200 whose body is not JSON, e.g. a challenge page
+            logger.warning(f"Error fetching matches: {e}")
+            return
+        finally:
+            self.ready.set()
+
+        if status == 304:
+            self.updated_at = time.time()
+        elif status == 200 and isinstance(matches, list):
+            self.matches = matches
+            self.version += 1
+            self.updated_at = time.time()
+
+
+_match_feed = None
+
+
+def get_match_feed(http):
+    """Return the process-wide match feed, created on first use with `http`."""
+    global _match_feed
+    if _match_feed is None:
+        _match_feed = MatchFeed(http)
+    return _match_feed
@@ -0,0 +1,97 @@
+import logging
+import os
+import random
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+
+class MediaIndex:
+    """
+    In-memory index of the media files in one folder.
+
+    The folder is scanned once and re-scanned only when its mtime changes
+    (checked at most every `check_interval` seconds), so picking a random file
+    is a random.choice over a list instead of an os.listdir per message. Files
+    up to `max_file_bytes` are kept in an LRU of at most `max_cache_bytes`, so
+    repeated sends of the same small asset skip the disk.
+    """
+
+    def __init__(self, folder, extensions, check_interval=5, max_file_bytes=2 * 1024 * 1024,
+                 max_cache_bytes=32 * 1024 * 1024):
+        self.folder = folder
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.check_interval = check_interval
+        self.max_file_bytes = max_file_bytes
+        self.max_cache_bytes = max_cache_bytes
+        self._files = []
+        self._folder_mtime = None
+        self._checked_at = None
+        self._blobs = OrderedDict()  # path -> (mtime_ns, bytes)
+        self._blob_bytes = 0
+
+    def _refresh(self):
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.folder).st_mtime_ns
+            if mtime == self._folder_mtime:
+                return
+            with os.scandir(self.folder) as entries:
+                files = [entry.path for entry in entries
+                         if entry.is_file() and entry.name.lower().endswith(self.extensions)]
+        except OSError as e:
+            logger.warning(f"Error retrieving files from {self.folder}: {e}")
+            self._files = []
+            self._folder_mtime = None
+            return
+        self._files = files
+        self._folder_mtime = mtime
+        present = set(files)
+        for path in [path for path in self._blobs if path not in present]:
+            self._blob_bytes -= len(self._blobs.pop(path)[1])
+
+    def pick(self):
+        """Return the path of a random matching file, or None if there are none."""
+        self._refresh()
+        return random.choice(self._files) if self._files else None
+
+    def read(self, path):
+        """
+        Return the contents of `path` if it is small enough to cache, else None.
+
+        Cached bytes are reused until the file's mtime changes.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if stat.st_size > self.max_file_bytes:
+            return None
+
+        cached = self._blobs.get(path)
+        if cached is not None and cached[0] == stat.st_mtime_ns:
+            self._blobs.move_to_end(path)
+            return cached[1]
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if cached is not None:
+            self._blob_bytes -= len(cached[1])
+        self._blobs[path] = (stat.st_mtime_ns, data)
+        self._blob_bytes += len(data)
+        while self._blob_bytes > self.max_cache_bytes and len(self._blobs) > 1:
+            _, (_, evicted) = self._blobs.popitem(last=False)
+            self._blob_bytes -= len(evicted)
+        return data
+
+    def __len__(self):
+        self._refresh()
+        return len(self._files)
@@ -0,0 +1,71 @@
+import random
+from collections import deque
+
+
+class GuildQueue:
+    """
+    Per-guild song queue: the track now playing plus a deque of upcoming tracks.
+
+    Only the event loop may mutate a queue; voice threads hand off to the loop
+    (see Music.after_playing) instead of touching it directly. Positions used by
+    move() and remove() are zero-based indexes into the upcoming tracks.
+    """
+
+    __slots__ = ("current", "channel", "_upcoming")
+
+    def __init__(self, channel=None):
+        self.current = None
+        self.channel = channel  # text channel that receives "Now playing" messages
+        self._upcoming = deque()
+
+    def __len__(self):
+        return len(self._upcoming)
+
+    def __iter__(self):
+        return iter(self._upcoming)
+
+    def __getitem__(self, index):
+        return self._upcoming[index]
+
+    @property
+    def is_idle(self):
+        """True when nothing is playing and nothing is waiting."""
+        return self.current is None and not self._upcoming
+
+    def append(self, track):
+        self._upcoming.append(track)
+
+    def extend(self, tracks):
+        """Enqueue many tracks at once."""
+        self._upcoming.extend(tracks)
+
+    def peek(self):
+        """Return the next track without removing it."""
+        return self._upcoming[0] if self._upcoming else None
+
+    def advance(self):
+        """Make the next track current in O(1) and return it (None when the queue ran out)."""
+        self.current = self._upcoming.popleft() if self._upcoming else None
+        return self.current
+
+    def shuffle(self):
+        """Shuffle the upcoming tracks in place."""
+        random.shuffle(self._upcoming)
+
+    def move(self, source, destination):
+        """Move the track at `source` to `destination` in place and return it."""
+        track = self._upcoming[source]
+        del self._upcoming[source]
+        self._upcoming.insert(destination, track)
+        return track
+
+    def remove(self, index):
+        """Remove and return the track at `index`."""
+        track = self._upcoming[index]
+        del self._upcoming[index]
+        return track
+
+    def clear(self):
+        """Drop every upcoming track and forget the current one."""
+        self._upcoming.clear()
+        self.current = None
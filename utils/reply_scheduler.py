@@ -0,0 +1,66 @@
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ReplyScheduler:
+    """
+    Batches delayed replies per channel.
+
+    The first message queued for a channel starts one worker that shows the
+    typing indicator, waits `delay` seconds and then replies to everything that
+    piled up in that channel meanwhile, so a burst of mentions costs one typing
+    call and one sleeping task instead of one each. At most `per_channel`
+    replies are pending per channel and `max_pending` overall; anything beyond
+    that is dropped.
+    """
+
+    def __init__(self, respond, delay=5, per_channel=5, max_pending=200):
+        self.respond = respond  # async callable(message)
+        self.delay = delay
+        self.per_channel = per_channel
+        self.max_pending = max_pending
+        self._pending = {}  # channel id -> [message, ...]
+        self._workers = {}  # channel id -> task
+        self._count = 0
+        self.dropped = 0
+
+    def submit(self, message):
+        """Queue a reply to `message`. Returns False if it was dropped."""
+        channel_id = message.channel.id
+        if len(self._pending.get(channel_id, ())) >= self.per_channel or self._count >= self.max_pending:
+            self.dropped += 1
+            return False
+
+        self._pending.setdefault(channel_id, []).append(message)
+        self._count += 1
+        if channel_id not in self._workers:
+            self._workers[channel_id] = asyncio.ensure_future(self._run(message.channel))
+        return True
+
+    async def _run(self, channel):
+        try:
+            while self._pending.get(channel.id):
+                async with channel.typing():
+                    await asyncio.sleep(self.delay)
+
+                batch = self._pending.pop(channel.id, [])
+                self._count -= len(batch)
+                for message in batch:
+                    try:
+                        await self.respond(message)
+                    except Exception as e:
+                        logger.warning(f"Could not reply in channel {channel.id}: {e}")
+        except Exception as e:
+            logger.warning(f"Reply worker for channel {channel.id} failed: {e}")
+        finally:
+            self._count -= len(self._pending.pop(channel.id, []))
+            self._workers.pop(channel.id, None)
+
+    def cancel(self):
+        for task in self._workers.values():
+            task.cancel()
+
+    def __len__(self):
+        return self._count
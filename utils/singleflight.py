@@ -0,0 +1,38 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
+
+    While a call for `key` is in flight, later callers with the same key await
+    the same future instead of starting their own request. Each caller is
+    shielded, so one cancelled caller does not cancel the shared call.
+    """
+
+    def __init__(self):
+        self._inflight = {}  # key -> future
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key, func, *args, **kwargs):
+        """Run `await func(*args, **kwargs)` unless a call for `key` is already running."""
+        future = self._inflight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(func(*args, **kwargs))
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.shared += 1
+        return await asyncio.shield(future)
+
+    def _forget(self, key, future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # Mark the exception as retrieved if every caller was cancelled before it finished
+        if not future.cancelled():
+            future.exception()
+
+    def __len__(self):
+        return len(self._inflight)
@@ -0,0 +1,193 @@
+import logging
+import time
+
+from config import MUSIC_VOICE_MAX_SESSIONS, MUSIC_VOICE_IDLE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class VoicePoolFull(Exception):
+    """Raised when connecting would exceed the per-process voice session cap."""
+
+
+class VoiceSessionLimit:
+    """
+    Process-wide cap on voice connections.
+
+    Every voice connection costs memory, sockets and usually an ffmpeg process,
+    all of which belong to the process, so every bot's pool draws its sessions
+    from the same limit.
+    """
+
+    def __init__(self, max_sessions=MUSIC_VOICE_MAX_SESSIONS):
+        self.max_sessions = max_sessions
+        self.in_use = 0
+
+    def acquire(self):
+        if self.in_use >= self.max_sessions:
+            raise VoicePoolFull(f"All {self.max_sessions} voice sessions are in use, please try again later.")
+        self.in_use += 1
+
+    def release(self):
+        self.in_use = max(0, self.in_use - 1)
+
+
+class VoiceSession:
+    """One guild's voice connection plus the bookkeeping the reaper and /voicestats need."""
+
+    __slots__ = ("guild_id", "voice_client", "created_at", "last_active", "tracks_played", "reconnects",
+                 "lost_since")
+
+    def __init__(self, guild_id, voice_client):
+        self.guild_id = guild_id
+        self.voice_client = voice_client
+        self.created_at = time.monotonic()
+        self.last_active = self.created_at
+        self.tracks_played = 0
+        self.reconnects = 0
+        self.lost_since = None  # when the connection was first seen down
+
+    def touch(self):
+        self.last_active = time.monotonic()
+
+    @property
+    def is_connected(self):
+        return self.voice_client.is_connected()
+
+    @property
+    def is_busy(self):
+        return self.voice_client.is_playing() or self.voice_client.is_paused()
+
+    @property
+    def idle_seconds(self):
+        return 0.0 if self.is_busy else time.monotonic() - self.last_active
+
+    @property
+    def uptime(self):
+        return time.monotonic() - self.created_at
+
+    @property
+    def listeners(self):
+        channel = self.voice_client.channel
+        return sum(1 for member in channel.members if not member.bot) if channel else 0
+
+
+class VoiceSessionPool:
+    """
+    Tracks every voice connection one bot holds.
+
+    New connections take a slot from `limit` (the process-wide cap unless one
+    is given) and give it back on disconnect; dropped connections are replaced
+    on the next connect, and reap_candidates() reports sessions that should be
+    closed because their channel is empty, they have been idle too long, or
+    their connection stayed down longer than nextcord's own reconnect needs.
+    """
+
+    def __init__(self, limit=None, idle_timeout=MUSIC_VOICE_IDLE_TIMEOUT, lost_grace=60):
+        self.limit = limit if limit is not None else get_voice_session_limit()
+        self.idle_timeout = idle_timeout
+        self.lost_grace = lost_grace
+        self._sessions = {}  # guild_id -> VoiceSession
+
+    def __contains__(self, guild_id):
+        return guild_id in self._sessions
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __iter__(self):
+        return iter(list(self._sessions.values()))
+
+    @property
+    def max_sessions(self):
+        return self.limit.max_sessions
+
+    def session(self, guild_id):
+        return self._sessions.get(guild_id)
+
+    def get(self, guild_id):
+        """Return the guild's voice client if it is still connected."""
+        session = self._sessions.get(guild_id)
+        if session is None or not session.is_connected:
+            return None
+        return session.voice_client
+
+    async def connect(self, channel):
+        """Connect to (or move to) `channel`, reconnecting if the old connection dropped."""
+        guild_id = channel.guild.id
+        session = self._sessions.get(guild_id)
+
+        if session is not None and session.is_connected:
+            if session.voice_client.channel != channel:
+                await session.voice_client.move_to(channel)
+            session.touch()
+            return session.voice_client
+
+        if session is None:
+            # Taken before the first await so concurrent connects cannot overshoot the cap
+            self.limit.acquire()
+        else:
+            # The old connection dropped; clean it up before connecting again
+            logger.info(f"Voice session for guild {guild_id} dropped, reconnecting")
+            try:
+                await session.voice_client.disconnect(force=True)
+            except Exception:
+                pass
+
+        try:
+            voice_client = await channel.connect()
+        except BaseException:
+            if session is None:
+                self.limit.release()
+            raise
+        if session is None:
+            session = self._sessions[guild_id] = VoiceSession(guild_id, voice_client)
+        else:
+            session.voice_client = voice_client
+            session.reconnects += 1
+            session.touch()
+        return voice_client
+
+    async def disconnect(self, guild_id):
+        """Stop playback, leave the channel and forget the session. Returns False if there was none."""
+        session = self._sessions.pop(guild_id, None)
+        if session is None:
+            return False
+        self.limit.release()
+        voice_client = session.voice_client
+        if voice_client.is_playing() or voice_client.is_paused():
+            voice_client.stop()
+        try:
+            await voice_client.disconnect(force=True)
+        except Exception as e:
+            logger.warning(f"Error disconnecting voice session for guild {guild_id}: {e}")
+        return True
+
+    def reap_candidates(self):
+        """Return (guild_id, reason) for every session that should be closed."""
+        candidates = []
+        now = time.monotonic()
+        for session in self._sessions.values():
+            if not session.is_connected:
+                if session.lost_since is None:
+                    session.lost_since = now
+                elif now - session.lost_since > self.lost_grace:
+                    candidates.append((session.guild_id, "connection lost"))
+                continue
+            session.lost_since = None
+            if session.listeners == 0:
+                candidates.append((session.guild_id, "everyone left the channel"))
+            elif session.idle_seconds > self.idle_timeout:
+                candidates.append((session.guild_id, "inactivity"))
+        return candidates
+
+
+_voice_session_limit = None
+
+
+def get_voice_session_limit():
+    """Return the process-wide voice session cap shared by every bot's pool."""
+    global _voice_session_limit
+    if _voice_session_limit is None:
+        _voice_session_limit = VoiceSessionLimit()
+    return _voice_session_limit
@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import os
+import threading
+import unicodedata
+
+from config import WEATHER_GEOCODE_CACHE_PATH, WEATHER_GEOCODE_CACHE_SIZE, WEATHER_FORECAST_TTL
+from utils.cache import TTLCache
+from utils.singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+
+def normalize_city(city):
+    """Cache key for a city name: Unicode-normalized, case-folded, single-spaced."""
+    city = unicodedata.normalize("NFKC", city).casefold()
+    return " ".join(city.replace(",", " , ").split()).replace(" ,", ",")
+
+
+class WeatherClient:
+    """
+    Async Open-Meteo client with two caches.
+
+    Geocoding results are kept in a JSON file so city lookups survive restarts;
+    forecasts are kept in memory for `forecast_ttl` seconds, keyed by coordinates
+    rounded to `precision` decimals (about 1 km), so nearby or repeated lookups
+    share one request. Concurrent misses for the same city or coordinates are
+    coalesced into a single upstream request.
+    """
+
+    def __init__(self, http, cache_path=WEATHER_GEOCODE_CACHE_PATH, max_geocodes=WEATHER_GEOCODE_CACHE_SIZE,
+                 forecast_ttl=WEATHER_FORECAST_TTL, precision=2):
+        self.http = http
+        self.cache_path = cache_path
+        self.max_geocodes = max_geocodes
+        self.precision = precision
+        self._geocodes = self._load_geocodes()
+        self._missing = TTLCache(maxsize=1024, ttl=60 * 60)  # unknown city names, not persisted
+        self._forecasts = TTLCache(maxsize=1024, ttl=forecast_ttl)
+        self._save_task = None
+        self._save_lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    def _load_geocodes(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable geocode cache {self.cache_path}: {e}")
+            return {}
+
+    def save(self, geocodes=None):
+        """Write the geocode cache (or the `geocodes` snapshot of it) atomically."""
+        directory = os.path.dirname(self.cache_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.cache_path}.tmp"
+        with self._save_lock:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(self._geocodes if geocodes is None else geocodes, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+
+    def _schedule_save(self, delay=5):
+        """Batch writes: save once, a few seconds after the first new entry."""
+        if self._save_task is not None and not self._save_task.done():
+            return
+
+        async def save_later():
+            await asyncio.sleep(delay)
+            try:
+                # Snapshot on the loop so the executor thread never iterates a dict that is being updated
+                await asyncio.get_running_loop().run_in_executor(None, self.save, dict(self._geocodes))
+            except OSError as e:
+                logger.warning(f"Could not save geocode cache: {e}")
+
+        self._save_task = asyncio.ensure_future(save_later())
+
+    async def geocode(self, city):
+        """Return {"name", "latitude", "longitude"} for `city`, or None if it is unknown."""
+        key = normalize_city(city)
+        location = self._geocodes.get(key)
+        if location is not None:
+            return location
+        if key in self._missing:
+            return None
+        return await self._flights.do(("geocode", key), self._fetch_geocode, city, key)
+
+    async def _fetch_geocode(self, city, key):
+        status, data = await self.http.get_json(GEOCODING_URL, params={"name": city, "count": 1})
+        if data is None:
+            # Rate limits and outages are not remembered as "city not found"
+            raise RuntimeError(f"Geocoding service returned HTTP {status}")
+        if not data.get("results"):
+            self._missing.set(key, True)
+            return None
+
+        result = data["results"][0]
+        location = {"name": result["name"], "latitude": result["latitude"], "longitude": result["longitude"]}
+        self._geocodes[key] = location
+        while len(self._geocodes) > self.max_geocodes:
+            del self._geocodes[next(iter(self._geocodes))]
+        self._schedule_save()
+        return location
+
+    async def forecast(self, latitude, longitude):
+        """Return the Open-Meteo forecast payload for the rounded coordinates."""
+        key = (round(latitude, self.precision), round(longitude, self.precision))
+        data = self._forecasts.get(key)
+        if data is not None:
+            return data
+        return await self._flights.do(("forecast", key), self._fetch_forecast, key)
+
+    async def _fetch_forecast(self, key):
+        status, data = await self.http.get_json(
+            FORECAST_URL,
+            params={"latitude": key[0], "longitude": key[1], "current_weather": "true"}
+        )
+        if data is None:
+            raise RuntimeError(f"Weather service returned HTTP {status}")
+        self._forecasts.set(key, data)
+        return data
+
+    async def get_weather(self, city):
+        """Return (weather_data, error) in the shape WeatherCog renders."""
+        try:
+            location = await self.geocode(city)
+            if location is None:
+                return None, "City not found!"
+
+            forecast = await self.forecast(location["latitude"], location["longitude"])
+            # Copy so the cached forecast is not tied to one city name
+            weather_data = dict(forecast)
+            weather_data['city'] = location["name"]
+            return weather_data, None
+        except Exception as e:
+            return None, str(e) or type(e).__name__
+
+    def close(self):
+        """Flush pending geocode entries to disk. The client stays usable, so any cog sharing it can call this."""
+        if self._save_task is not None and not self._save_task.done():
+            self._save_task.cancel()
+            try:
+                self.save()
+            except OSError as e:
+                logger.warning(f"Could not save geocode cache: {e}")
+
+
+_weather_client = None
+
+
+def get_weather_client(http):
+    """
+    Return the process-wide weather client, created on first use with `http`.
+
+    Every bot in the process shares it, so there is one in-memory copy of the
+    geocode cache and one writer for its file.
+    """
+    global _weather_client
+    if _weather_client is None:
+        _weather_client = WeatherClient(http)
+    return _weather_client
@@ -0,0 +1,389 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse, parse_qs
+
+from yt_dlp import YoutubeDL
+
+from config import (MUSIC_RESOLVER_WORKERS, MUSIC_RESOLVER_PER_GUILD, MUSIC_RESOLVER_TIMEOUT,
+                    MUSIC_SEARCH_CACHE_TTL, MUSIC_SEARCH_CACHE_SIZE, MUSIC_PLAYLIST_LIMIT,
+                    MUSIC_PLAYBACK_MODE)
+from utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# In "opus" playback mode prefer Opus streams (YouTube serves them in WebM) so they can be passed through
+TRACK_FORMAT = 'bestaudio[acodec=opus]/bestaudio/best' if MUSIC_PLAYBACK_MODE == 'opus' else 'bestaudio/best'
+
+# Options for a single extraction that yields both metadata and a playable stream URL
+TRACK_YDL_OPTS = {
+    'format': TRACK_FORMAT,
+    'noplaylist': True,
+    'quiet': True,
+}
+
+# Flat extraction lists playlist entries without resolving each video
+PLAYLIST_YDL_OPTS = {
+    'quiet': True,
+    'extract_flat': 'in_playlist',
+    'lazy_playlist': True,
+}
+
+# Marks the end of a streamed playlist
+_PLAYLIST_DONE = object()
+
+# Stream URLs without an explicit expiry are assumed to be valid for this long
+DEFAULT_STREAM_TTL = 5 * 60 * 60
+
+
+class Track:
+    """Everything the queue needs to know about a song, taken from one extraction."""
+
+    __slots__ = ("title", "webpage_url", "stream_url", "duration", "thumbnail", "expires_at", "codec")
+
+    def __init__(self, title, webpage_url, stream_url=None, duration=None, thumbnail=None, expires_at=None,
+                 codec=None):
+        self.title = title
+        self.webpage_url = webpage_url
+        self.stream_url = stream_url
+        self.duration = duration
+        self.thumbnail = thumbnail
+        self.expires_at = expires_at
+        self.codec = codec  # audio codec of the stream, e.g. "opus"
+
+    @classmethod
+    def from_info(cls, info):
+        """Build a track from a yt-dlp info dict."""
+        stream_url = info.get('url')
+        return cls(
+            title=info.get('title', 'Unknown Title'),
+            webpage_url=info.get('webpage_url') or info.get('original_url') or stream_url,
+            stream_url=stream_url,
+            duration=info.get('duration'),
+            thumbnail=info.get('thumbnail'),
+            expires_at=stream_expiry(stream_url) if stream_url else None,
+            codec=info.get('acodec'),
+        )
+
+    def expires_within(self, seconds):
+        """True when the stream URL is missing or will expire in the next `seconds`."""
+        return not self.stream_url or (self.expires_at is not None and self.expires_at - seconds <= time.time())
+
+    @classmethod
+    def from_entry(cls, entry):
+        """Build an unresolved track from a flat playlist entry, or None if it has no usable URL."""
+        url = entry.get('webpage_url') or entry.get('url') or ''
+        if not is_url(url):
+            if entry.get('ie_key') == 'Youtube' and entry.get('id'):
+                url = f"https://www.youtube.com/watch?v={entry['id']}"
+            else:
+                return None
+        thumbnails = entry.get('thumbnails') or []
+        return cls(
+            title=entry.get('title') or 'Unknown Title',
+            webpage_url=url,
+            duration=entry.get('duration'),
+            thumbnail=entry.get('thumbnail') or (thumbnails[-1].get('url') if thumbnails else None),
+        )
+
+    @property
+    def is_expired(self):
+        return self.expires_within(30)
+
+    def update_from_info(self, info):
+        """Refresh the stream details in place from a new extraction."""
+        fresh = Track.from_info(info)
+        self.stream_url = fresh.stream_url
+        self.expires_at = fresh.expires_at
+        self.codec = fresh.codec
+        self.duration = self.duration or fresh.duration
+        self.thumbnail = self.thumbnail or fresh.thumbnail
+
+    @property
+    def duration_text(self):
+        if not self.duration:
+            return "live" if self.duration == 0 else "unknown"
+        minutes, seconds = divmod(int(self.duration), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+    def __repr__(self):
+        return f"<Track title={self.title!r} url={self.webpage_url!r}>"
+
+
+def stream_expiry(stream_url):
+    """Read the `expire` timestamp googlevideo puts in stream URLs, or guess one."""
+    expire = parse_qs(urlparse(stream_url).query).get('expire')
+    if expire:
+        try:
+            return float(expire[0])
+        except ValueError:
+            pass
+    return time.time() + DEFAULT_STREAM_TTL
+
+
+def is_url(query):
+    return query.startswith(('http://', 'https://'))
+
+
+def normalize_query(query):
+    """Case- and whitespace-insensitive cache key for a search query."""
+    return " ".join(query.lower().split())
+
+
+class SearchCache(TTLCache):
+    """
+    Cache of search results keyed by normalized query.
+
+    When a query misses, results cached for a shorter prefix of it (what the user
+    had typed a moment earlier) are filtered down to titles that still match every
+    typed word, so autocomplete can answer without a new extraction.
+    """
+
+    def __init__(self, maxsize=MUSIC_SEARCH_CACHE_SIZE, ttl=MUSIC_SEARCH_CACHE_TTL, min_prefix=3):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.min_prefix = min_prefix
+        self.prefix_hits = 0
+
+    def get_results(self, query, allow_prefix=False, count=True):
+        """
+        Return cached results for `query`, or None on a miss.
+
+        Pass count=False for repeat lookups of a query the caller already
+        counted, so one request is never recorded as several misses.
+        """
+        key = normalize_query(query)
+        item = self._lookup(key)
+        if item is not None:
+            if count:
+                self.hits += 1
+            return item[1]
+
+        if allow_prefix:
+            words = key.split()
+            for end in range(len(key) - 1, self.min_prefix - 1, -1):
+                item = self._lookup(key[:end].rstrip())
+                if item is None:
+                    continue
+                matches = [result for result in item[1]
+                           if all(word in result["title"].lower() for word in words)]
+                if matches:
+                    if count:
+                        self.prefix_hits += 1
+                    return matches
+
+        if count:
+            self.misses += 1
+        return None
+
+    def set_results(self, query, results):
+        self.set(normalize_query(query), results)
+
+    def stats(self):
+        stats = super().stats()
+        stats["prefix_hits"] = self.prefix_hits
+        return stats
+
+
+# Shared by every guild (and every bot in the process) so repeated queries are free
+search_cache = SearchCache()
+
+
+class YTDLResolver:
+    """
+    Runs yt-dlp extractions on a bounded worker pool so the event loop never blocks.
+
+    Each guild may only have `per_guild` extractions in flight at once, so a single
+    busy guild cannot occupy every worker while other guilds wait. Playlist
+    listings have their own limit of one per guild, so a long import never holds
+    the slots that playing its first songs needs.
+    """
+
+    def __init__(self, max_workers=MUSIC_RESOLVER_WORKERS, per_guild=MUSIC_RESOLVER_PER_GUILD,
+                 timeout=MUSIC_RESOLVER_TIMEOUT):
+        self.max_workers = max_workers
+        self.per_guild = per_guild
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ytdl")
+        self._guild_slots = {}  # guild_id -> [semaphore, users]
+        self._listing_slots = {}  # guild_id -> [semaphore, users], one playlist listing at a time
+        self._producers = set()  # playlist listing tasks that can outlive the generator that started them
+
+    @staticmethod
+    def _extract_sync(query, ydl_opts, process=True):
+        """Blocking extraction, only ever called from a worker thread."""
+        with YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(query, download=False, process=process)
+
+    def _acquire_slot(self, guild_id, slots=None, size=None):
+        slots = self._guild_slots if slots is None else slots
+        slot = slots.get(guild_id)
+        if slot is None:
+            slot = slots[guild_id] = [asyncio.Semaphore(size or self.per_guild), 0]
+        slot[1] += 1
+        return slot[0]
+
+    def _release_slot(self, guild_id, slots=None):
+        slots = self._guild_slots if slots is None else slots
+        slot = slots.get(guild_id)
+        if slot is None:
+            return
+        slot[1] -= 1
+        if slot[1] <= 0:
+            del slots[guild_id]
+
+    async def extract(self, query, ydl_opts, guild_id=None, timeout=None, process=True):
+        """
+        Extract info for `query` off the event loop.
+
+        Raises asyncio.TimeoutError if the extraction takes longer than `timeout`
+        seconds. Cancelling the caller drops the job if it has not started yet; a
+        job already running in a worker finishes in the background and is discarded.
+        """
+        semaphore = self._acquire_slot(guild_id)
+        try:
+            async with semaphore:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(self._executor, self._extract_sync, query, ydl_opts, process)
+                try:
+                    return await asyncio.wait_for(future, timeout=timeout or self.timeout)
+                except asyncio.TimeoutError:
+                    logger.warning(f"yt-dlp extraction timed out after {timeout or self.timeout}s: {query}")
+                    raise
+        finally:
+            self._release_slot(guild_id)
+
+    async def resolve_track(self, query, guild_id=None):
+        """
+        Resolve a URL or search query to a Track with a single extraction.
+
+        Searches use `ytsearch1:` so the top result comes back fully processed,
+        stream URL included, instead of searching and then extracting again.
+        """
+        target = query if is_url(query) else f"ytsearch1:{query}"
+        info = await self.extract(target, TRACK_YDL_OPTS, guild_id=guild_id)
+        if info is None:
+            return None
+        if 'entries' in info:
+            entries = [entry for entry in info['entries'] if entry]
+            if not entries:
+                return None
+            info = entries[0]
+        return Track.from_info(info)
+
+    async def refresh_track(self, track, guild_id=None):
+        """Re-extract a queued track's stream URL just before it is needed."""
+        info = await self.extract(track.webpage_url, TRACK_YDL_OPTS, guild_id=guild_id)
+        track.update_from_info(info)
+        return track
+
+    async def iter_playlist(self, url, guild_id=None, limit=MUSIC_PLAYLIST_LIMIT):
+        """
+        Yield flat playlist entries as yt-dlp pages through the playlist.
+
+        The worker thread pushes entries onto the loop as they arrive, so callers
+        can start playing the first entry before the rest of the playlist is known.
+        A single video URL yields just that video.
+
+        Only the producer holds a (listing) slot, and only while it runs in the
+        worker; the caller's code between entries never holds one, so it can
+        resolve streams for the same guild while the listing continues.
+        """
+        loop = asyncio.get_running_loop()
+        entries = asyncio.Queue()
+        stopped = threading.Event()
+
+        def push(item):
+            try:
+                loop.call_soon_threadsafe(entries.put_nowait, item)
+            except RuntimeError:
+                stopped.set()  # the loop is gone
+
+        def produce():
+            if stopped.is_set():
+                push(_PLAYLIST_DONE)
+                return  # the caller gave up while this listing was queued
+            try:
+                with YoutubeDL(PLAYLIST_YDL_OPTS) as ydl:
+                    info = ydl.extract_info(url, download=False, process=False)
+                    if not info:
+                        return
+                    items = info.get('entries')
+                    if items is None:
+                        items = [info]
+                    for count, entry in enumerate(items):
+                        if stopped.is_set() or count >= limit:
+                            break
+                        if entry:
+                            push(entry)
+            except Exception as e:
+                push(e)
+            finally:
+                push(_PLAYLIST_DONE)
+
+        started = asyncio.Event()
+
+        async def run_producer():
+            semaphore = self._acquire_slot(guild_id, self._listing_slots, 1)
+            try:
+                async with semaphore:
+                    started.set()
+                    await loop.run_in_executor(self._executor, produce)
+            except Exception as e:
+                push(e)
+                push(_PLAYLIST_DONE)
+            finally:
+                started.set()
+                self._release_slot(guild_id, self._listing_slots)
+
+        # Not cancelled when the caller stops early: `stopped` makes the worker
+        # finish on its own, and the slot is released only once it has
+        producer = asyncio.ensure_future(run_producer())
+        self._producers.add(producer)
+        producer.add_done_callback(self._producers.discard)
+        try:
+            # Waiting behind another import of this guild is not part of the timeout
+            await started.wait()
+            while True:
+                item = await asyncio.wait_for(entries.get(), timeout=self.timeout)
+                if item is _PLAYLIST_DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
+    def stats(self):
+        """Return a snapshot of pool usage."""
+        return {
+            "workers": self.max_workers,
+            "active_guilds": len(self._guild_slots),
+            "pending": sum(users for _, users in self._guild_slots.values()),
+            "listings": sum(users for _, users in self._listing_slots.values()),
+        }
+
+    def shutdown(self):
+        """Stop accepting work and drop queued extractions."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_resolver = None
+
+
+def get_resolver():
+    """Return the process-wide resolver, creating it on first use."""
+    global _resolver
+    if _resolver is None:
+        _resolver = YTDLResolver()
+    return _resolver
+
+
+def shutdown_resolver():
+    """Shut the process-wide resolver down, if it was ever created."""
+    global _resolver
+    if _resolver is not None:
+        _resolver.shutdown()
+        _resolver = None